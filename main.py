@@ -3,9 +3,11 @@
 import sys
 from PyQt5.QtWidgets import QApplication, QStyleFactory
 from ui.main_window import MainWindow
+from utils.constants import APPLICATION_NAME
 
 def main():
     app = QApplication(sys.argv)
+    app.setApplicationName(APPLICATION_NAME)
     app.setStyle(QStyleFactory.create('Fusion'))
 
     window = MainWindow()
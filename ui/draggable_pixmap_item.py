@@ -2,34 +2,71 @@
 
 from PyQt5.QtWidgets import QGraphicsPixmapItem
 from PyQt5.QtCore import Qt, QRectF, QPointF
-from PyQt5.QtGui import QCursor
 
 EDGE_SIZE = 10
 
 class DraggablePixmapItem(QGraphicsPixmapItem):
+    # Cursor shapes, not QCursors: a QCursor can't be built before the app exists
+    OPEN_HAND_CURSOR = Qt.OpenHandCursor
+    ARROW_CURSOR = Qt.ArrowCursor
+    SIZE_ALL_CURSOR = Qt.SizeAllCursor
+
     def __init__(self, pixmap):
         super().__init__(pixmap)
+        # No ItemSendsGeometryChanges: itemChange is not overridden, so the
+        # notifications would only cost a call per move
         self.setFlags(
             self.flags() |
             QGraphicsPixmapItem.ItemIsMovable |
-            QGraphicsPixmapItem.ItemIsSelectable |
-            QGraphicsPixmapItem.ItemSendsGeometryChanges
+            QGraphicsPixmapItem.ItemIsSelectable
         )
         self.setTransformationMode(Qt.SmoothTransformation)
+        # Smooth-scale once per zoom level and blit the result while panning
+        self.setCacheMode(QGraphicsPixmapItem.DeviceCoordinateCache)
         self.setAcceptedMouseButtons(Qt.LeftButton)
         self.is_rotating = False
+        self.current_cursor = None
+        self.update_edge_rect()
+
+    def setPixmap(self, pixmap):
+        super().setPixmap(pixmap)
+        self.update_edge_rect()
+
+    def reuse(self, pixmap):
+        """
+        Prepares an item recycled from an unloaded folder to show a new image.
+
+        Args:
+            pixmap (QPixmap): The new image.
+        """
+        self.setPixmap(pixmap)
+        self.setRotation(0)
+        self.setSelected(False)
+        self.is_rotating = False
+
+    def update_edge_rect(self):
+        # The rotation handle only moves when the pixmap changes, so build it once
+        # instead of on every hover move
+        rect = self.boundingRect()
+        self.edge_rect = QRectF(rect.width() - EDGE_SIZE, rect.height() - EDGE_SIZE, EDGE_SIZE, EDGE_SIZE)
+
+    def set_cursor(self, cursor):
+        # Most hover moves keep the same cursor; skip the redundant update
+        if cursor != self.current_cursor:
+            self.current_cursor = cursor
+            self.setCursor(cursor)
 
     def hoverMoveEvent(self, event):
         if self.is_near_edge(event.pos()):
-            self.setCursor(Qt.OpenHandCursor)
+            self.set_cursor(self.OPEN_HAND_CURSOR)
         else:
-            self.setCursor(Qt.ArrowCursor)
+            self.set_cursor(self.ARROW_CURSOR)
         super().hoverMoveEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton and self.is_near_edge(event.pos()):
             self.is_rotating = True
-            self.setCursor(Qt.SizeAllCursor)
+            self.set_cursor(self.SIZE_ALL_CURSOR)
             self.orig_pos = event.scenePos()
             self.orig_angle = self.rotation()
         else:
@@ -47,10 +84,8 @@ class DraggablePixmapItem(QGraphicsPixmapItem):
 
     def mouseReleaseEvent(self, event):
         self.is_rotating = False
-        self.setCursor(Qt.ArrowCursor)
+        self.set_cursor(self.ARROW_CURSOR)
         super().mouseReleaseEvent(event)
 
     def is_near_edge(self, pos):
-        rect = self.boundingRect()
-        edge_rect = QRectF(rect.width() - EDGE_SIZE, rect.height() - EDGE_SIZE, EDGE_SIZE, EDGE_SIZE)
-        return edge_rect.contains(pos)
+        return self.edge_rect.contains(pos)
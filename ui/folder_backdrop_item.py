@@ -1,8 +1,8 @@
 # ui/folder_backdrop_item.py
 
 from PyQt5.QtWidgets import QGraphicsItem
-from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics
-from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QPainter, QBrush, QColor, QFont, QFontMetrics, QStaticText, QTransform
+from PyQt5.QtCore import QRectF, QPointF, Qt
 
 
 class FolderBackdropItem(QGraphicsItem):
@@ -16,7 +16,7 @@ class FolderBackdropItem(QGraphicsItem):
 
         Args:
             folder_name (str): The name of the folder.
-            rect (QRectF): The rectangle defining the backdrop's position and size.
+            rect (QRectF): The backdrop rectangle in item coordinates.
             parent (QGraphicsItem, optional): The parent item. Defaults to None.
         """
         super().__init__(parent)
@@ -24,6 +24,7 @@ class FolderBackdropItem(QGraphicsItem):
         self.backdrop_rect = rect
         self.setZValue(-1)  # Ensure backdrop is behind images
         self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.backdrop_brush = QBrush(QColor(40, 40, 40, 100))
         # Text properties
         self.font = QFont("Arial", 14)
         self.text_color = QColor(Qt.white)
@@ -32,7 +33,12 @@ class FolderBackdropItem(QGraphicsItem):
         # Calculate text bounding box using QFontMetrics
         self.font_metrics = QFontMetrics(self.font)
         self.text_bbox = self.font_metrics.boundingRect(self.folder_name)
+        self.update_text_rects()
 
+    def update_text_rects(self):
+        """
+        Derives the label and overall rectangles from backdrop_rect.
+        """
         # Define text_rect positioned above the backdrop_rect
         self.text_rect = QRectF(
             self.backdrop_rect.left(),
@@ -48,19 +54,30 @@ class FolderBackdropItem(QGraphicsItem):
             self.backdrop_rect.width(),
             self.backdrop_rect.height() + self.text_bbox.height() + self.text_margin
         )
-        
-    def paint(self, painter: QPainter, option, widget=None):
-        # Draw backdrop
-        painter.setBrush(QColor(40, 40, 40, 100))
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(self.backdrop_rect)
 
-        # Draw folder name with elision
-        painter.setFont(self.font)
-        painter.setPen(self.text_color)
-        fm = QFontMetrics(self.font)
-        elided_text = fm.elidedText(self.folder_name, Qt.ElideRight, self.text_rect.width())
-        painter.drawText(self.text_rect, Qt.AlignCenter, elided_text)
+        # Lay the label out once per geometry change; paint only replays the glyphs.
+        # QStaticText stays vector, so the label remains sharp when zoomed in.
+        elided_text = self.font_metrics.elidedText(self.folder_name, Qt.ElideRight, int(self.text_rect.width()))
+        self.label = QStaticText(elided_text)
+        self.label.setTextFormat(Qt.PlainText)
+        self.label.prepare(QTransform(), self.font)
+        label_size = self.label.size()
+        self.label_pos = QPointF(
+            self.text_rect.left() + (self.text_rect.width() - label_size.width()) / 2,
+            self.text_rect.top() + (self.text_rect.height() - label_size.height()) / 2
+        )
+
+    def set_backdrop_rect(self, rect):
+        """
+        Resizes the backdrop. The rectangle is in item coordinates, like the one passed to __init__;
+        the item itself is moved with setPos.
+
+        Args:
+            rect (QRectF): The new backdrop rectangle.
+        """
+        self.prepareGeometryChange()
+        self.backdrop_rect = rect
+        self.update_text_rects()
 
     def boundingRect(self):
         """
@@ -80,12 +97,10 @@ class FolderBackdropItem(QGraphicsItem):
             option: Style options.
             widget: The widget being painted on.
         """
-        # Draw backdrop
-        painter.setBrush(QColor(40, 40, 40, 100))
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(self.backdrop_rect)
+        # Draw backdrop; fillRect leaves the pen out entirely
+        painter.fillRect(self.backdrop_rect, self.backdrop_brush)
 
-        # Draw folder name
+        # Draw folder name, laid out in update_text_rects
         painter.setFont(self.font)
         painter.setPen(self.text_color)
-        painter.drawText(self.text_rect, Qt.AlignCenter, self.folder_name)
+        painter.drawStaticText(self.label_pos, self.label)
@@ -0,0 +1,36 @@
+# ui/folder_group_item.py
+
+from PyQt5.QtWidgets import QGraphicsItem
+from PyQt5.QtCore import QRectF
+
+
+class FolderGroupItem(QGraphicsItem):
+    """
+    Invisible parent for all image items of one folder.
+
+    Unlike QGraphicsItemGroup it does not take over its children's mouse events,
+    so each image stays individually draggable, while the whole folder can be
+    added to or removed from the scene in a single call.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initializes the FolderGroupItem.
+
+        Args:
+            parent (QGraphicsItem, optional): The parent item. Defaults to None.
+        """
+        super().__init__(parent)
+        self.setFlag(QGraphicsItem.ItemHasNoContents, True)
+
+    def boundingRect(self):
+        """
+        The group draws nothing itself; children report their own bounds.
+
+        Returns:
+            QRectF: An empty rectangle.
+        """
+        return QRectF()
+
+    def paint(self, painter, option, widget=None):
+        pass
@@ -1,37 +1,103 @@
 # ui/graphics_view.py
 
 from PyQt5.QtWidgets import QGraphicsView, QMenu, QMessageBox, QApplication
-from PyQt5.QtCore import Qt, QRect, QPoint, QRectF, QTimer, pyqtSignal
-from PyQt5.QtGui import QWheelEvent, QMouseEvent, QCursor, QPainter
+from PyQt5.QtCore import Qt, QPoint, QRectF, QTimer, pyqtSignal
+from PyQt5.QtGui import QWheelEvent, QMouseEvent, QPainter
 from utils.constants import (
     EDGE_RESIZE_MARGIN, RIGHT_CLICK_DRAG_THRESHOLD, INFINITE_CANVAS_SIZE
 )
 from ui.draggable_pixmap_item import DraggablePixmapItem
 
 
+# Edge bits of a resize direction; a direction is the OR of one or two of them
+EDGE_RIGHT = 1
+EDGE_LEFT = 2
+EDGE_BOTTOM = 4
+EDGE_TOP = 8
+
+
+def resize_direction_for_edges(edges):
+    """
+    Picks the resize direction for a set of edges the cursor is near. Corners win
+    over single edges, matching the order the checks were originally made in, so
+    a view smaller than two margins never resizes two opposite edges at once.
+
+    Args:
+        edges (int): OR of the EDGE_* bits whose margin the cursor is in.
+
+    Returns:
+        int: The EDGE_* bits to resize, or 0 if no edge is near.
+    """
+    for direction in (
+        EDGE_TOP | EDGE_LEFT, EDGE_TOP | EDGE_RIGHT,
+        EDGE_BOTTOM | EDGE_LEFT, EDGE_BOTTOM | EDGE_RIGHT,
+        EDGE_TOP, EDGE_BOTTOM, EDGE_LEFT, EDGE_RIGHT
+    ):
+        if edges & direction == direction:
+            return direction
+    return 0
+
+
+# Every edge combination, indexed by its EDGE_* bits
+RESIZE_DIRECTIONS = tuple(resize_direction_for_edges(edges) for edges in range(16))
+
+# Cursor shapes rather than QCursor objects: a QCursor built at import time aborts
+# startup because no QGuiApplication exists yet
+RESIZE_CURSORS = {
+    EDGE_LEFT: Qt.SizeHorCursor,
+    EDGE_RIGHT: Qt.SizeHorCursor,
+    EDGE_TOP: Qt.SizeVerCursor,
+    EDGE_BOTTOM: Qt.SizeVerCursor,
+    EDGE_TOP | EDGE_LEFT: Qt.SizeFDiagCursor,
+    EDGE_BOTTOM | EDGE_RIGHT: Qt.SizeFDiagCursor,
+    EDGE_TOP | EDGE_RIGHT: Qt.SizeBDiagCursor,
+    EDGE_BOTTOM | EDGE_LEFT: Qt.SizeBDiagCursor,
+}
+ARROW_CURSOR = Qt.ArrowCursor
+
+RIGHT_CLICK_DRAG_THRESHOLD_SQ = RIGHT_CLICK_DRAG_THRESHOLD * RIGHT_CLICK_DRAG_THRESHOLD
+
+
 class GraphicsView(QGraphicsView):
     # Define custom signals for Clear Canvas, Settings, and Reset View
     clear_canvas_signal = pyqtSignal()
     open_settings_signal = pyqtSignal()
     reset_view_signal = pyqtSignal()
+    zoom_changed = pyqtSignal(float)  # scale_factor_total
+    visible_area_changed = pyqtSignal()  # after pans, zooms and resizes
+    items_moved = pyqtSignal(list)  # items a left-button drag or rotation may have moved
 
     def __init__(self, scene, mainwindow):
         super().__init__(scene)
         self.mainwindow = mainwindow
         self.zoom_factor = 1.15
+        self.zoom_out_factor = 1 / self.zoom_factor
 
-        # In GraphicsView __init__
-        self.setCacheMode(QGraphicsView.CacheBackground)
-        self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
-        self.setRenderHint(QPainter.Antialiasing, False)
-        self.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        # Configure the view in one batch; scroll bars go first so the viewport
+        # geometry is settled before the update mode is chosen
+        self.setUpdatesEnabled(False)
 
         # Disable scroll bars
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        # The background is a plain fill from the stylesheet, and any pan or zoom would
+        # throw a cached copy away anyway
+        self.setCacheMode(QGraphicsView.CacheNone)
+        # With hundreds of thumbnails, tracking dirty regions per item costs more than
+        # repainting the whole viewport
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Every item sets its own pen/brush/font/hints before drawing and nothing is antialiased
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+        self.setRenderHint(QPainter.Antialiasing, False)
+        self.setRenderHint(QPainter.SmoothPixmapTransform, True)
         self.setTransformationAnchor(QGraphicsView.NoAnchor)
 
+        self.setUpdatesEnabled(True)
+
         self.scale_factor_total = 1.0
+        self.context_menu = self.build_context_menu()
 
         # Panning attributes
         self.panning = False
@@ -46,9 +112,29 @@ class GraphicsView(QGraphicsView):
 
         # Window resizing attributes
         self.resizing_window = False
-        self.resize_direction = None
+        self.resize_direction = 0  # EDGE_* bits
         self.window_drag_start_pos = QPoint()
         self.window_start_geometry = None
+        self.current_cursor = None
+        # Far edge thresholds for get_resize_direction; they only change in resizeEvent
+        self.update_edge_thresholds()
+
+        # Panning and window drag/resize moves are coalesced to one update per frame;
+        # mice can report far more often than the screen refreshes
+        self.pending_move_pos = QPoint()
+        self.pending_move_global_pos = QPoint()
+        self.move_throttle_timer = QTimer(self)
+        self.move_throttle_timer.setSingleShot(True)
+        self.move_throttle_timer.setTimerType(Qt.PreciseTimer)
+        self.move_throttle_timer.timeout.connect(self.apply_pending_move)
+
+        # Wheel steps arriving before the event loop comes back round are applied as one zoom
+        self.pending_zoom = 1.0
+        self.pending_zoom_pos = QPoint()
+        self.zoom_timer = QTimer(self)
+        self.zoom_timer.setSingleShot(True)
+        self.zoom_timer.setInterval(0)
+        self.zoom_timer.timeout.connect(self.apply_pending_zoom)
 
     def wheelEvent(self, event: QWheelEvent):
         """
@@ -57,18 +143,38 @@ class GraphicsView(QGraphicsView):
         Args:
             event (QWheelEvent): The wheel event.
         """
-        old_pos = self.mapToScene(event.pos())
         if event.angleDelta().y() > 0:
-            zoom = self.zoom_factor
+            self.pending_zoom *= self.zoom_factor
         else:
-            zoom = 1 / self.zoom_factor
+            self.pending_zoom *= self.zoom_out_factor
+        self.pending_zoom_pos = event.pos()
+        if not self.zoom_timer.isActive():
+            self.zoom_timer.start()
 
+    def apply_pending_zoom(self):
+        """
+        Applies the wheel steps accumulated since the last zoom as a single scale,
+        keeping the scene point under the cursor in place.
+        """
+        zoom = self.pending_zoom
+        self.pending_zoom = 1.0
+        if zoom == 1.0:
+            return
+        old_pos = self.mapToScene(self.pending_zoom_pos)
+
+        # Scale and re-anchor without intermediate updates, then repaint once
+        mode = self.viewportUpdateMode()
+        self.setViewportUpdateMode(QGraphicsView.NoViewportUpdate)
         self.scale(zoom, zoom)
         self.scale_factor_total *= zoom
 
-        new_pos = self.mapToScene(event.pos())
+        new_pos = self.mapToScene(self.pending_zoom_pos)
         delta = new_pos - old_pos
         self.translate(delta.x(), delta.y())
+        self.setViewportUpdateMode(mode)
+        self.viewport().update()
+        self.zoom_changed.emit(self.scale_factor_total)
+        self.visible_area_changed.emit()
 
     def mousePressEvent(self, event: QMouseEvent):
         """
@@ -113,52 +219,108 @@ class GraphicsView(QGraphicsView):
         Args:
             event (QMouseEvent): The mouse move event.
         """
-        if self.panning and (event.buttons() & Qt.MiddleButton):
-            # Perform panning
-            dx = (event.x() - self.pan_start_view.x()) / self.scale_factor_total
-            dy = (event.y() - self.pan_start_view.y()) / self.scale_factor_total
-            self.translate(dx, dy)
-            self.pan_start_view = event.pos()
+        # Each accessor call builds a new wrapper object, so fetch them once per event
+        pos = event.pos()
+        buttons = event.buttons()
+        if self.panning and (buttons & Qt.MiddleButton):
+            # Perform panning on the next throttled update
+            self.schedule_move(pos, event.globalPos())
             event.accept()
-        elif self.right_click_pressed and (event.buttons() & Qt.RightButton):
-            # Calculate movement distance
-            move_dist = (event.pos() - self.right_click_press_pos)
+        elif self.right_click_pressed and (buttons & Qt.RightButton):
             if not self.right_click_dragging:
                 # Determine if movement exceeds the threshold to start dragging
-                if (abs(move_dist.x()) > RIGHT_CLICK_DRAG_THRESHOLD or
-                        abs(move_dist.y()) > RIGHT_CLICK_DRAG_THRESHOLD):
+                move_dist = pos - self.right_click_press_pos
+                mx, my = move_dist.x(), move_dist.y()
+                if mx * mx + my * my > RIGHT_CLICK_DRAG_THRESHOLD_SQ:
                     self.right_click_dragging = True
 
             if self.right_click_dragging:
-                # Perform window dragging
-                delta = event.globalPos() - self.win_drag_start_global
-                new_pos = self.win_start_pos + delta
-                self.mainwindow.move(new_pos)
+                # Perform window dragging on the next throttled update
+                self.schedule_move(pos, event.globalPos())
                 event.accept()
             else:
                 # Pass the event to the base class for default handling
                 super().mouseMoveEvent(event)
-        elif self.resizing_window and (event.buttons() & Qt.LeftButton):
-            # Perform window resizing
-            self.handle_window_resize(event.globalPos())
+        elif self.resizing_window and (buttons & Qt.LeftButton):
+            # Perform window resizing on the next throttled update
+            self.schedule_move(pos, event.globalPos())
             event.accept()
         else:
             # Change cursor based on hover position
             if not self.panning and not self.resizing_window and not self.right_click_dragging:
-                edge = self.get_resize_direction(event.pos())
-                if edge:
-                    if edge in ('left', 'right'):
-                        self.setCursor(Qt.SizeHorCursor)
-                    elif edge in ('top', 'bottom'):
-                        self.setCursor(Qt.SizeVerCursor)
-                    elif edge in ('top-left', 'bottom-right'):
-                        self.setCursor(Qt.SizeFDiagCursor)
-                    elif edge in ('top-right', 'bottom-left'):
-                        self.setCursor(Qt.SizeBDiagCursor)
+                x, y = pos.x(), pos.y()
+                if (EDGE_RESIZE_MARGIN <= x <= self.right_edge_threshold
+                        and EDGE_RESIZE_MARGIN <= y <= self.bottom_edge_threshold):
+                    # Away from every edge, which is nearly every hover move
+                    self.set_cursor(ARROW_CURSOR)
                 else:
-                    self.setCursor(Qt.ArrowCursor)
+                    edge = self.get_resize_direction(pos)
+                    self.set_cursor(RESIZE_CURSORS[edge] if edge else ARROW_CURSOR)
+            if not buttons:
+                # A plain hover: no item on the canvas accepts hover events, so the base
+                # class would only hit-test the scene under the cursor for nothing
+                return
             super().mouseMoveEvent(event)
 
+    def set_cursor(self, cursor):
+        """
+        Sets the view's cursor, skipping the update when it is already showing it.
+
+        Args:
+            cursor (Qt.CursorShape): The cursor shape to show.
+        """
+        if cursor != self.current_cursor:
+            self.current_cursor = cursor
+            self.setCursor(cursor)
+
+    def schedule_move(self, pos, global_pos):
+        """
+        Records the latest position of a pan or window drag/resize and makes sure an
+        update is pending. Moves arriving before the update fires only replace the position.
+
+        Args:
+            pos (QPoint): The cursor position in view coordinates.
+            global_pos (QPoint): The cursor position in screen coordinates.
+        """
+        self.pending_move_pos = pos
+        self.pending_move_global_pos = global_pos
+        if not self.move_throttle_timer.isActive():
+            self.move_throttle_timer.start(self.frame_interval())
+
+    def frame_interval(self):
+        """
+        Returns the refresh interval of the screen the window is on, so coalesced
+        moves are applied once per displayed frame. Falls back to 60 Hz.
+
+        Returns:
+            int: The interval in milliseconds.
+        """
+        handle = self.window().windowHandle()
+        screen = handle.screen() if handle is not None else QApplication.primaryScreen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return max(1, int(1000 / rate)) if rate > 0 else 16
+
+    def apply_pending_move(self):
+        """
+        Performs the pan, window drag or window resize for the latest recorded position.
+        """
+        self.move_throttle_timer.stop()
+        if self.panning:
+            dx = (self.pending_move_pos.x() - self.pan_start_view.x()) / self.scale_factor_total
+            dy = (self.pending_move_pos.y() - self.pan_start_view.y()) / self.scale_factor_total
+            mode = self.viewportUpdateMode()
+            self.setViewportUpdateMode(QGraphicsView.NoViewportUpdate)
+            self.translate(dx, dy)
+            self.setViewportUpdateMode(mode)
+            self.viewport().update()
+            self.pan_start_view = self.pending_move_pos
+            self.visible_area_changed.emit()
+        elif self.right_click_dragging:
+            delta = self.pending_move_global_pos - self.win_drag_start_global
+            self.mainwindow.move(self.win_start_pos + delta)
+        elif self.resizing_window:
+            self.handle_window_resize(self.pending_move_global_pos)
+
     def mouseReleaseEvent(self, event: QMouseEvent):
         """
         Handles mouse release events to terminate panning, right-click dragging, or window resizing.
@@ -166,6 +328,9 @@ class GraphicsView(QGraphicsView):
         Args:
             event (QMouseEvent): The mouse release event.
         """
+        if self.move_throttle_timer.isActive():
+            # Land exactly where the drag ended before leaving the drag state
+            self.apply_pending_move()
         if event.button() == Qt.MiddleButton:
             # Terminate panning
             self.panning = False
@@ -181,9 +346,18 @@ class GraphicsView(QGraphicsView):
         elif event.button() == Qt.LeftButton and self.resizing_window:
             # Terminate window resizing
             self.resizing_window = False
-            self.resize_direction = None
-            self.setCursor(Qt.ArrowCursor)
+            self.resize_direction = 0
+            self.set_cursor(ARROW_CURSOR)
             event.accept()
+        elif event.button() == Qt.LeftButton:
+            # The grabbed item was dragged or rotated, and a drag takes the whole selection along
+            moved = self.scene().selectedItems()
+            grabber = self.scene().mouseGrabberItem()
+            if grabber is not None and grabber not in moved:
+                moved.append(grabber)
+            super().mouseReleaseEvent(event)
+            if moved:
+                self.items_moved.emit(moved)
         else:
             # Pass the event to the base class for default handling
             super().mouseReleaseEvent(event)
@@ -195,27 +369,24 @@ class GraphicsView(QGraphicsView):
         Args:
             global_pos (QPoint): The global position where the menu should appear.
         """
-        menu = QMenu()
+        self.context_menu.exec_(global_pos)
+
+    def build_context_menu(self):
+        """
+        Creates the canvas context menu once; each action is wired straight to its signal.
+
+        Returns:
+            QMenu: The context menu.
+        """
+        menu = QMenu(self)
 
         # Existing actions
-        reset_action = menu.addAction("Reset to Center")
-        clear_canvas_action = menu.addAction("Clear Canvas")
-        settings_action = menu.addAction("Settings")
+        menu.addAction("Reset to Center").triggered.connect(self.reset_view_signal)
+        menu.addAction("Clear Canvas").triggered.connect(self.clear_canvas_signal)
+        menu.addAction("Settings").triggered.connect(self.open_settings_signal)
         menu.addSeparator()
-        exit_action = menu.addAction("Exit")
-
-        chosen = menu.exec_(global_pos)
-        if chosen == exit_action:
-            QApplication.quit()
-        elif chosen == reset_action:
-            # Emit signal to reset view
-            self.reset_view_signal.emit()
-        elif chosen == clear_canvas_action:
-            # Emit signal to clear canvas
-            self.clear_canvas_signal.emit()
-        elif chosen == settings_action:
-            # Emit signal to open settings
-            self.open_settings_signal.emit()
+        menu.addAction("Exit").triggered.connect(QApplication.quit)
+        return menu
 
     def get_resize_direction(self, pos):
         """
@@ -225,32 +396,29 @@ class GraphicsView(QGraphicsView):
             pos (QPoint): The position of the mouse within the view.
 
         Returns:
-            str or None: The direction for resizing (e.g., 'top-left', 'right') or None if not near an edge.
+            int: The EDGE_* bits to resize (e.g. EDGE_TOP | EDGE_LEFT), or 0 if not near an edge.
         """
-        rect = self.rect()
+        # Called on every mouse move, so this is a single table lookup
         x, y = pos.x(), pos.y()
-        left = x < EDGE_RESIZE_MARGIN
-        right = x > rect.width() - EDGE_RESIZE_MARGIN
-        top = y < EDGE_RESIZE_MARGIN
-        bottom = y > rect.height() - EDGE_RESIZE_MARGIN
-
-        if top and left:
-            return 'top-left'
-        elif top and right:
-            return 'top-right'
-        elif bottom and left:
-            return 'bottom-left'
-        elif bottom and right:
-            return 'bottom-right'
-        elif top:
-            return 'top'
-        elif bottom:
-            return 'bottom'
-        elif left:
-            return 'left'
-        elif right:
-            return 'right'
-        return None
+        return RESIZE_DIRECTIONS[
+            (EDGE_TOP if y < EDGE_RESIZE_MARGIN else 0)
+            | (EDGE_BOTTOM if y > self.bottom_edge_threshold else 0)
+            | (EDGE_LEFT if x < EDGE_RESIZE_MARGIN else 0)
+            | (EDGE_RIGHT if x > self.right_edge_threshold else 0)
+        ]
+
+    def update_edge_thresholds(self):
+        """
+        Recomputes the coordinates beyond which the cursor is near the right or bottom edge.
+        """
+        rect = self.rect()
+        self.right_edge_threshold = rect.width() - EDGE_RESIZE_MARGIN
+        self.bottom_edge_threshold = rect.height() - EDGE_RESIZE_MARGIN
+
+    def resizeEvent(self, event):
+        self.update_edge_thresholds()
+        super().resizeEvent(event)
+        self.visible_area_changed.emit()
 
     def handle_window_resize(self, global_pos):
         """
@@ -268,22 +436,22 @@ class GraphicsView(QGraphicsView):
         right = g.x() + g.width()
         bottom = g.y() + g.height()
 
-        if 'left' in self.resize_direction:
+        if self.resize_direction & EDGE_LEFT:
             new_left = left + dx
             if new_left < right - 100:  # Minimum width
                 left = new_left
-        if 'right' in self.resize_direction:
+        if self.resize_direction & EDGE_RIGHT:
             new_right = right + dx
             if new_right > left + 100:  # Minimum width
                 right = new_right
-        if 'top' in self.resize_direction:
+        if self.resize_direction & EDGE_TOP:
             new_top = top + dy
             if new_top < bottom - 100:  # Minimum height
                 top = new_top
-        if 'bottom' in self.resize_direction:
+        if self.resize_direction & EDGE_BOTTOM:
             new_bottom = bottom + dy
             if new_bottom > top + 100:  # Minimum height
                 bottom = new_bottom
 
         # Apply the new geometry to the main window
-        self.mainwindow.setGeometry(QRect(QPoint(left, top), QPoint(right, bottom)))
+        self.mainwindow.setGeometry(left, top, right - left, bottom - top)
@@ -3,7 +3,7 @@
 import sys
 import os
 import json
-import string
+from collections import deque
 from math import ceil
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QGraphicsView, QGraphicsScene, QFileDialog,
@@ -12,64 +12,32 @@ from PyQt5.QtWidgets import (
     QGraphicsRectItem, QGraphicsTextItem, QDialog, QHBoxLayout, QLabel, QSpinBox, QPushButton
 )
 from PyQt5.QtCore import (
-    Qt, QPointF, QPoint, QRectF, QEvent, QRect, QRunnable, QThreadPool,
-    pyqtSignal, QObject, QTimer, QThread
+    Qt, QPoint, QRectF, QEvent, QRect, QThreadPool,
+    QTimer, QThread, QSemaphore, QStandardPaths
 )
 from PyQt5.QtGui import (
-    QWheelEvent, QMouseEvent, QPixmap, QPainter, QPalette, QColor, QPen, QFont
+    QWheelEvent, QMouseEvent, QPixmap, QPixmapCache, QPainter, QPalette, QColor, QPen, QFont
 )
 
 from ui.graphics_view import GraphicsView  # Ensure this import points to your fixed graphics_view.py
 from ui.draggable_pixmap_item import DraggablePixmapItem
 from ui.folder_backdrop_item import FolderBackdropItem  # Import the custom item
-from utils.image_cache import LRUCache  # Import the LRUCache
+from ui.folder_group_item import FolderGroupItem
+from utils.image_cache import LRUCache, DiskThumbnailCache
+from workers.image_loader import ImageLoadSignals, ImageLoadWorker
+from workers.directory_walker import DirectoryWalkSignals, DirectoryWalkWorker
+from workers.directory_lister import DirectoryListSignals, DirectoryListWorker
+from utils.helpers import json_loads, json_dumps, write_bytes_atomic, get_windows_drives
+from utils.layout import FolderLayout, SkylinePacker, layout_grid
 from utils.constants import (
     UNIFORM_HEIGHT, COLUMNS, SPACING_X, SPACING_Y,
-    INFINITE_CANVAS_SIZE, SUPPORTED_IMAGE_FORMATS, FAVORITES_FILE, CONFIG_FILE
+    INFINITE_CANVAS_SIZE, FAVORITES_FILE, CONFIG_FILE, APPLICATION_NAME, THUMBNAIL_CACHE_SUBDIR,
+    LOD_ZOOM_THRESHOLD, MOSAIC_MAX_SIZE, CULL_MARGIN, ITEM_POOL_SIZE, IMAGE_BATCH_SIZE,
+    PIXMAP_CACHE_LIMIT_KB, FOLDER_PACK_WIDTH
 )
 
 
 
-class ImageLoadSignals(QObject):
-    finished = pyqtSignal(str, str, QPixmap, float)  # folder_path, filepath, pix, scale_factor
-    error = pyqtSignal(str, Exception)
-    progress = pyqtSignal(int)
-
-
-class ImageLoadWorker(QRunnable):
-    def __init__(self, folder_path, filepaths, uniform_height, image_cache):
-        super().__init__()
-        self.folder_path = folder_path
-        self.filepaths = filepaths
-        self.uniform_height = uniform_height
-        self.signals = ImageLoadSignals()
-        self.image_cache = image_cache
-
-    def run(self):
-        for i, filepath in enumerate(self.filepaths):
-            try:
-                # Check if pixmap is in cache
-                pix = self.image_cache.get(filepath)
-                if pix is None:
-                    # Load from disk
-                    pix = QPixmap(filepath)
-                    if pix.isNull():
-                        raise ValueError(f"Could not load image: {filepath}")
-                    # Store in cache
-                    self.image_cache.put(filepath, pix)
-
-                scale_factor = self.uniform_height / pix.height()
-
-                # Emit finished for each image
-                self.signals.finished.emit(self.folder_path, filepath, pix, scale_factor)
-
-                # Emit progress
-                progress = int((i + 1) / len(self.filepaths) * 100)
-                self.signals.progress.emit(progress)
-            except Exception as e:
-                self.signals.error.emit(filepath, e)
-
-
 class SettingsDialog(QDialog):
     """
     Dialog for adjusting layout settings such as columns and spacing.
@@ -168,19 +136,45 @@ class MainWindow(QMainWindow):
         self.SPACING_Y = SPACING_Y
 
         # Load settings from configuration file
+        self.last_saved_settings = None  # Bytes of the last settings write, to skip identical rewrites
         self.load_settings()
 
         self.thread_pool = QThreadPool()
         self.thread_pool.setMaxThreadCount(max(QThreadPool.globalInstance().maxThreadCount(), 4))
 
+        # Caps decoded images waiting for the GUI thread at two batches per pool thread; workers
+        # acquire a slot before decoding and on_images_loaded/on_image_load_error give it back
+        self.decode_slots = QSemaphore(2 * IMAGE_BATCH_SIZE * self.thread_pool.maxThreadCount())
+        self.pending_decodes = 0  # Upper bound on images submitted to workers but not yet handed back
+
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.hide()
 
-        self.image_cache = LRUCache(capacity=200)  # Adjust capacity as needed
+        self.image_cache = LRUCache(capacity=512)  # 512 thumbnails ~150 px tall, so roughly 60 MB
+        # Content hash -> path key of the first file seen with those bytes; entries are small tuples
+        self.content_index = LRUCache(capacity=4096)
+        # Workers hand back the same shared QImage for a cached thumbnail, so its cacheKey
+        # finds the pixmap made from it last time, e.g. when a folder is unchecked and checked again
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        self.thumbnail_cache = DiskThumbnailCache(os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.CacheLocation), THUMBNAIL_CACHE_SUBDIR))
+
+        # Worker signal objects are created once, owned by the window and shared by every
+        # worker of their kind; results are queued onto the GUI thread
+        self.image_load_signals = ImageLoadSignals(self)
+        self.image_load_signals.finished.connect(self.on_images_loaded)
+        self.image_load_signals.error.connect(self.on_image_load_error)
+
+        self.directory_walk_signals = DirectoryWalkSignals(self)
+        self.directory_walk_signals.found.connect(self.on_paths_found)
+        self.directory_walk_signals.finished.connect(self.on_folder_scanned)
 
         self.scene = QGraphicsScene()
         self.scene.setSceneRect(-INFINITE_CANVAS_SIZE//2, -INFINITE_CANVAS_SIZE//2, INFINITE_CANVAS_SIZE, INFINITE_CANVAS_SIZE)
+        # Folders are added, moved and relaid out in bulk, and the view mostly shows whole
+        # folders at once; keeping a BSP tree over thousands of items costs more than it saves
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
 
         # Initialize GraphicsView and connect custom signals
         self.view = GraphicsView(self.scene, self)
@@ -190,6 +184,17 @@ class MainWindow(QMainWindow):
         self.view.clear_canvas_signal.connect(self.clear_canvas)
         self.view.open_settings_signal.connect(self.open_settings_dialog)
         self.view.reset_view_signal.connect(self.reset_view)  # Connect the new reset_view_signal
+        self.view.zoom_changed.connect(self.update_level_of_detail)
+        self.low_detail_active = False  # True while folders are shown as mosaics
+        # Image items of unloaded folders, reused by later loads; the oldest fall out when full
+        self.item_pool = deque(maxlen=ITEM_POOL_SIZE)
+        # Folders outside the viewport are hidden; checks are coalesced to one per event-loop pass
+        self.cull_timer = QTimer(self)
+        self.cull_timer.setSingleShot(True)
+        self.cull_timer.setInterval(0)
+        self.cull_timer.timeout.connect(self.cull_offscreen_folders)
+        self.view.visible_area_changed.connect(self.cull_timer.start)
+        self.view.items_moved.connect(self.on_items_moved)
 
         right_container = QWidget()
         right_layout = QVBoxLayout(right_container)
@@ -198,19 +203,34 @@ class MainWindow(QMainWindow):
         right_layout.addWidget(self.view)
         right_layout.addWidget(self.progress_bar)
 
-        self.favorites = self.load_favorites_from_json()
+        self.favorites = self.load_favorites_from_json()  # Favorite folders, in order, as keys; values are unused
+        self.last_saved_favorites = None  # Bytes of the last favorites write, to skip identical rewrites
+        # Favorites edits are written after a short quiet period instead of on every change
+        self.favorites_save_timer = QTimer(self)
+        self.favorites_save_timer.setSingleShot(True)
+        self.favorites_save_timer.setInterval(500)
+        self.favorites_save_timer.timeout.connect(self.save_favorites_to_json)
+        # The context menu's Exit calls QApplication.quit(), which skips closeEvent
+        QApplication.instance().aboutToQuit.connect(self.flush_favorites_save)
+        QApplication.instance().aboutToQuit.connect(self.stop_image_workers)
         # Updated data structure: folder_path -> {'images': [...], 'backdrop': ...}
         self.loaded_images = {}
-        self.current_folder_offset_x = 0  # where the next folder should start horizontally
+        self.folder_packer = SkylinePacker(FOLDER_PACK_WIDTH)  # where the next folder goes
 
-        self.loaded_folders_order = []  # To maintain the order of loaded folders
+        self.loaded_folders_order = {}  # Loaded folders in load order, as keys; values are unused
+        self.scanning_folders = {}  # folder_path -> DirectoryWalkWorker still collecting its file list
 
-        self.folder_load_counts = {}
-        self.folder_loaded_counts = {}
+        self.folder_workers = {}  # folder_path -> image workers still decoding it, so an unload can cancel them
         # Per-folder placement data
-        # {folder_path: {"current_x", "current_y", "images_in_row", "row_max_height", "folder_max_width", "folder_total_height", "image_relative_positions"}}
+        # {folder_path: FolderLayout}
         self.folder_placement_data = {}
 
+        # Tree items whose subdirectories are being listed in the background, keyed by path
+        self.pending_directory_listings = {}
+        self.directory_list_signals = DirectoryListSignals(self)
+        self.directory_list_signals.listed.connect(self.on_directory_listed)
+        self.directory_list_signals.error.connect(self.on_directory_list_error)
+
         self.directory_tree = QTreeWidget()
         self.directory_tree.setHeaderLabel("Folders")
         self.directory_tree.setMinimumWidth(200)
@@ -226,8 +246,14 @@ class MainWindow(QMainWindow):
         self.favorites_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.favorites_tree.customContextMenuRequested.connect(self.on_favorites_context_menu)
         self.favorites_tree.itemChanged.connect(self.handle_favorites_item_changed)
-        for folder_path in self.favorites:
-            self.add_favorite_item(folder_path)
+
+        # Context menus are built once and reused on every right-click
+        self.directories_menu = QMenu(self)
+        self.add_favorite_action = self.directories_menu.addAction("Add to Favorites")
+        self.favorites_menu = QMenu(self)
+        self.remove_favorite_action = self.favorites_menu.addAction("Remove from Favorites")
+        # Built unattached and inserted in one call rather than one insertion per favorite
+        self.favorites_tree.addTopLevelItems([self.make_favorite_item(folder_path) for folder_path in self.favorites])
 
         self.tabs = QTabWidget()
         self.tabs.addTab(self.directory_tree, "Directories")
@@ -299,66 +325,87 @@ class MainWindow(QMainWindow):
 
     def initialize_directory_tree(self):
         self.directory_tree.clear()
+        self.pending_directory_listings.clear()
         if sys.platform.startswith('win'):
-            drives = self.get_windows_drives()
+            drives = get_windows_drives()
             for drive in drives:
                 self.populate_tree(drive, self.directory_tree)
         else:
             self.populate_tree("/", self.directory_tree)
 
-    def get_windows_drives(self):
-        drives = []
-        if sys.platform.startswith('win'):
-            try:
-                from ctypes import windll
-                bitmask = windll.kernel32.GetLogicalDrives()
-                for letter in string.ascii_uppercase:
-                    if bitmask & 1:
-                        drives.append(f"{letter}:\\")
-                    bitmask >>= 1
-            except:
-                pass
-        return drives
-
     def populate_tree(self, root_path, parent_widget):
         root_name = os.path.basename(root_path)
         if not root_name.strip():
             root_name = root_path
-        root_item = QTreeWidgetItem(parent_widget, [root_name])
-        root_item.setData(0, Qt.UserRole, root_path)
-        root_item.setFlags(root_item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        root_item.setCheckState(0, Qt.Unchecked)
-        if self.has_subdirectories(root_path):
-            dummy = QTreeWidgetItem()
-            dummy.setText(0, "")
-            root_item.addChild(dummy)
-
-    def has_subdirectories(self, path):
-        try:
-            for entry in os.scandir(path):
-                if entry.is_dir():
-                    return True
-        except PermissionError:
-            pass
-        return False
+        root_item = self.make_directory_item(root_name, root_path)
+        parent_widget.addTopLevelItem(root_item)
+        # Roots are shown expanded (expandAll does not emit itemExpanded), so list them right away
+        self.list_directory(root_item)
+
+    def make_directory_item(self, name, path):
+        """
+        Builds an unattached, checkable tree item for a directory. It shows an expand
+        arrow without looking inside the directory; whether it really has subdirectories
+        is only found out when it is expanded.
+
+        Args:
+            name (str): The text shown for the directory.
+            path (str): The directory's path.
+
+        Returns:
+            QTreeWidgetItem: The new item.
+        """
+        item = QTreeWidgetItem([name])
+        item.setData(0, Qt.UserRole, path)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        item.setCheckState(0, Qt.Unchecked)
+        item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        return item
+
+    def list_directory(self, item):
+        """
+        Starts listing a directory item's subdirectories, unless that already happened.
+
+        Args:
+            item (QTreeWidgetItem): The tree item for the directory.
+        """
+        path = item.data(0, Qt.UserRole)
+        if item.childIndicatorPolicy() != QTreeWidgetItem.ShowIndicator or path in self.pending_directory_listings:
+            return
+        self.pending_directory_listings[path] = item
+        # Listed on the global pool so it never waits behind image decoding
+        QThreadPool.globalInstance().start(DirectoryListWorker(path, self.directory_list_signals))
 
     def on_item_expanded(self, item):
-        if item.childCount() == 1 and not item.child(0).text(0):
-            item.removeChild(item.child(0))
-            path = item.data(0, Qt.UserRole)
-            try:
-                for entry in os.scandir(path):
-                    if entry.is_dir():
-                        child_item = QTreeWidgetItem(item, [entry.name])
-                        child_item.setData(0, Qt.UserRole, entry.path)
-                        child_item.setFlags(child_item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                        child_item.setCheckState(0, Qt.Unchecked)
-                        if self.has_subdirectories(entry.path):
-                            dummy = QTreeWidgetItem()
-                            dummy.setText(0, "")
-                            child_item.addChild(dummy)
-            except PermissionError:
-                QMessageBox.warning(self, "Permission Denied", f"Cannot access {path}")
+        self.list_directory(item)
+
+    def on_directory_listed(self, path, subdirs):
+        """
+        Adds the subdirectories of an expanded item. A folder with no subdirectories
+        simply ends up childless and loses its expand arrow.
+
+        Args:
+            path (str): The listed directory.
+            subdirs (list): (name, path) pairs of its subdirectories.
+        """
+        item = self.pending_directory_listings.pop(path, None)
+        if item is None:
+            # The tree was rebuilt while the listing was running
+            return
+        children = [self.make_directory_item(name, subdir_path) for name, subdir_path in subdirs]
+        # Adding checkable items would otherwise emit itemChanged for every child
+        self.directory_tree.blockSignals(True)
+        item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
+        item.addChildren(children)
+        self.directory_tree.blockSignals(False)
+
+    def on_directory_list_error(self, path, error):
+        item = self.pending_directory_listings.pop(path, None)
+        if item is None:
+            return
+        item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
+        if isinstance(error, PermissionError):
+            QMessageBox.warning(self, "Permission Denied", f"Cannot access {path}")
 
     def handle_directory_item_changed(self, item, column):
         self.directory_tree.blockSignals(True)
@@ -381,116 +428,170 @@ class MainWindow(QMainWindow):
     def load_images_from_folder(self, folder_path):
         """
         Loads images from the specified folder, utilizing the image cache.
+        The folder is scanned on the thread pool; decoding starts in on_paths_found
+        as soon as the first paths are in.
 
         Args:
             folder_path (str): The path of the folder to load images from.
         """
-        if folder_path in self.loaded_images:
-            # Already loaded
+        if folder_path in self.folder_placement_data or folder_path in self.scanning_folders:
+            # Already loaded or loading
             return False
 
-        file_paths = []
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if self.is_supported_image(file):
-                    file_paths.append(os.path.join(root, file))
+        walker = DirectoryWalkWorker(folder_path, self.directory_walk_signals)
+        self.scanning_folders[folder_path] = walker
+        self.thread_pool.start(walker)
 
-        if not file_paths:
-            QMessageBox.information(self, "No Images", f"No supported images found in {folder_path}")
+    def on_paths_found(self, folder_path, walker, file_paths):
+        """
+        Starts decoding a chunk of image paths found by a folder's scan.
+
+        Args:
+            folder_path (str): The folder being scanned.
+            walker (DirectoryWalkWorker): The scan that found the paths.
+            file_paths (list): Paths of supported images found since the previous chunk.
+        """
+        if self.scanning_folders.get(folder_path) is not walker:
+            # Unchecked while the scan was running, or from an older scan of the same folder
             return
 
-        self.folder_load_counts[folder_path] = len(file_paths)
-        self.folder_loaded_counts[folder_path] = 0
-
-        # Initialize placement data for this folder
-        self.folder_placement_data[folder_path] = {
-            "current_x": self.current_folder_offset_x,
-            "current_y": 0,
-            "images_in_row": 0,
-            "row_max_height": 0,
-            "folder_max_width": 0,
-            "folder_total_height": 0,
-            "image_relative_positions": []  # To store relative positions of images
+        data = self.folder_placement_data.get(folder_path)
+        if data is None:
+            data = self.start_folder_load(folder_path)
+
+        # Indices continue from earlier chunks, so file order survives chunking
+        first_index = data.image_count
+        data.image_count += len(file_paths)
+        data.pixmaps.extend([None] * len(file_paths))
+
+        # Fan the decode out over the pool; strided chunks keep arrival roughly in file order
+        indexed_paths = list(enumerate(file_paths, first_index))
+        chunk_count = min(self.thread_pool.maxThreadCount(), len(file_paths))
+        self.pending_decodes += len(file_paths)
+        workers = self.folder_workers.setdefault(folder_path, [])
+        for i in range(chunk_count):
+            worker = ImageLoadWorker(
+                folder_path, indexed_paths[i::chunk_count], self.UNIFORM_HEIGHT,
+                self.image_cache, self.content_index, self.thumbnail_cache, self.image_load_signals,
+                self.decode_slots
+            )
+            workers.append(worker)
+            self.thread_pool.start(worker)
+
+    def start_folder_load(self, folder_path):
+        """
+        Sets up the bookkeeping for a folder once its scan finds the first images.
+
+        Args:
+            folder_path (str): The folder being loaded.
+
+        Returns:
+            FolderLayout: The folder's (still empty) load progress and placement data.
+        """
+        # Initialize load progress and placement data for this folder; counts grow with each chunk
+        data = self.folder_placement_data[folder_path] = FolderLayout(0)
+
+        # Images are parented to a group that is added to the scene once the folder completes
+        self.loaded_images[folder_path] = {
+            "images": [],
+            "backdrop": None,
+            "group": FolderGroupItem(),
+            "mosaic": None,
+            # Scene rectangle covering the backdrop and every image, set once the folder completes
+            "bounds": None,
+            "on_screen": True
         }
 
         # Append folder to the ordered list
-        self.loaded_folders_order.append(folder_path)
+        self.loaded_folders_order[folder_path] = None
 
         self.progress_bar.show()
         self.progress_bar.setValue(0)
+        return data
 
-        worker = ImageLoadWorker(folder_path, file_paths, self.UNIFORM_HEIGHT, self.image_cache)
-        worker.signals.finished.connect(self.on_image_loaded)
-        worker.signals.error.connect(self.on_image_load_error)
-        worker.signals.progress.connect(self.update_progress)
-
-        self.thread_pool.start(worker)
-
-    def on_image_loaded(self, folder_path, filepath, pix, scale_factor):
-        data = self.folder_placement_data[folder_path]
-        current_x = data["current_x"]
-        current_y = data["current_y"]
-        images_in_row = data["images_in_row"]
-        row_max_height = data["row_max_height"]
-        folder_max_width = data["folder_max_width"]
-        folder_total_height = data["folder_total_height"]
-
-        image_width = pix.width() * scale_factor
-        image_height = pix.height() * scale_factor
-
-        # Check if we need a new row
-        if images_in_row == self.COLUMNS:
-            # Finish previous row
-            folder_total_height += row_max_height + self.SPACING_Y
-            # Move down to next row
-            current_y = folder_total_height
-            current_x = self.current_folder_offset_x
-            images_in_row = 0
-            row_max_height = 0
-
-        # Place image
-        item = DraggablePixmapItem(pix)
-        item.setAcceptedMouseButtons(Qt.LeftButton)
-        self.scene.addItem(item)
-        item.setPos(QPointF(current_x, current_y))
-        item.setScale(scale_factor)
+    def on_folder_scanned(self, folder_path, walker):
+        """
+        Called once a folder's scan has handed over all of its paths.
 
-        if folder_path not in self.loaded_images:
-            self.loaded_images[folder_path] = {
-                "images": [],
-                "backdrop": None
-            }
-        self.loaded_images[folder_path]["images"].append(item)
+        Args:
+            folder_path (str): The scanned folder.
+            walker (DirectoryWalkWorker): The scan that finished.
+        """
+        if self.scanning_folders.get(folder_path) is not walker:
+            # Unchecked while the scan was running
+            return
+        del self.scanning_folders[folder_path]
 
-        # Calculate and store relative position
-        relative_x = current_x - (self.current_folder_offset_x - self.SPACING_X)
-        relative_y = current_y + self.SPACING_Y  # Assuming backdrop is above by SPACING_Y
-        data["image_relative_positions"].append((relative_x, relative_y))
+        data = self.folder_placement_data.get(folder_path)
+        if data is None:
+            QMessageBox.information(self, "No Images", f"No supported images found in {folder_path}")
+            return
+        if data.loaded_count == data.image_count:
+            # Every image found was decoded before the scan itself finished
+            self.update_progress(100)
+            self.on_folder_load_complete(folder_path)
 
-        # Update row and folder metrics
-        current_x += image_width + self.SPACING_X
-        if image_height > row_max_height:
-            row_max_height = image_height
+    def on_images_loaded(self, folder_path, batch):
+        """
+        Stores a batch of decoded thumbnails; layout happens once the whole folder is in.
 
-        # Update max width
-        width_used_this_row = current_x - self.current_folder_offset_x - self.SPACING_X
-        if width_used_this_row > folder_max_width:
-            folder_max_width = width_used_this_row
+        Args:
+            folder_path (str): The folder the images belong to.
+            batch (list): (index, img) pairs, where index is the image's position in the
+                folder's file list and img a QImage already at the uniform height.
+        """
+        self.release_decode_slot(len(batch))
+        if folder_path not in self.folder_placement_data:
+            # Folder was unloaded while its workers were still running
+            return
+        # Workers only produce QImages; pixmaps are created here on the GUI thread
+        pixmaps = self.folder_placement_data[folder_path].pixmaps
+        pixmap_for_image = self.pixmap_for_image
+        for index, img in batch:
+            pixmaps[index] = pixmap_for_image(img)
+        self.on_image_processed(folder_path, len(batch))
+
+    def pixmap_for_image(self, img):
+        """
+        Returns a pixmap for a decoded thumbnail, reusing the one already made from
+        the same image data if QPixmapCache still holds it.
 
-        images_in_row += 1
+        Args:
+            img (QImage): The thumbnail.
 
-        # Store updated data
-        data["current_x"] = current_x
-        data["current_y"] = current_y
-        data["images_in_row"] = images_in_row
-        data["row_max_height"] = row_max_height
-        data["folder_max_width"] = folder_max_width
-        data["folder_total_height"] = folder_total_height
+        Returns:
+            QPixmap: The pixmap.
+        """
+        key = str(img.cacheKey())
+        pix = QPixmapCache.find(key)
+        if pix is None:
+            pix = QPixmap.fromImage(img)
+            QPixmapCache.insert(key, pix)
+        return pix
+
+    def on_image_processed(self, folder_path, count=1):
+        """
+        Counts finished (or failed) images for a folder and updates progress.
+        Results from all chunk workers arrive here on the GUI thread, so the counters need no locking.
 
-        self.folder_loaded_counts[folder_path] += 1
+        Args:
+            folder_path (str): The folder the images belong to.
+            count (int, optional): How many images finished. Defaults to 1.
+        """
+        data = self.folder_placement_data[folder_path]
+        data.loaded_count += count
+        loaded = data.loaded_count
+        total = data.image_count
+        # The total can still grow while the folder is being scanned
+        scanning = folder_path in self.scanning_folders
+        # Report at most ~20 steps per folder instead of once per image
+        step = max(1, total // 20)
+        if loaded == total or loaded // step != (loaded - count) // step:
+            progress = int(loaded / total * 100)
+            self.update_progress(min(progress, 99) if scanning else progress)
 
         # Check if all images for folder are done
-        if self.folder_loaded_counts[folder_path] == self.folder_load_counts[folder_path]:
+        if loaded == total and not scanning:
             self.on_folder_load_complete(folder_path)
 
     def on_folder_load_complete(self, folder_path):
@@ -501,39 +602,251 @@ class MainWindow(QMainWindow):
         Args:
             folder_path (str): The path of the loaded folder.
         """
+        self.folder_workers.pop(folder_path, None)
         data = self.folder_placement_data[folder_path]
-        images_in_row = data["images_in_row"]
-        row_max_height = data["row_max_height"]
-        folder_total_height = data["folder_total_height"]
-        folder_max_width = data["folder_max_width"]
-
-        # Add the last row's height (if any images in last row)
-        if images_in_row > 0:
-            folder_total_height += row_max_height
-
-        # Define the backdrop rectangle
-        rect_left = self.current_folder_offset_x - self.SPACING_X
-        rect_top = -self.SPACING_Y
-        rect_width = folder_max_width + 2 * self.SPACING_X
-        rect_height = folder_total_height + 2 * self.SPACING_Y
+        pixmaps = [pix for pix in data.pixmaps if pix is not None]
+        data.pixmaps = None
+        if not pixmaps:
+            # Every image in the folder failed to load; there is nothing to frame
+            del self.loaded_images[folder_path]
+            del self.folder_placement_data[folder_path]
+            del self.loaded_folders_order[folder_path]
+            return
 
-        backdrop_rect = QRectF(rect_left, rect_top, rect_width, rect_height)
+        # Place every image in one pass, in file order, in the group's own coordinates
+        group = self.loaded_images[folder_path]["group"]
+        images = self.loaded_images[folder_path]["images"]
+        item_pool = self.item_pool
+        for pix in pixmaps:
+            if item_pool:
+                item = item_pool.pop()
+                item.reuse(pix)
+            else:
+                # The constructor already limits the item to the left button
+                item = DraggablePixmapItem(pix)
+            item.setParentItem(group)
+            images.append(item)
+        self.layout_folder_images(folder_path)
+
+        # Add all of the folder's images to the scene in one go
+        self.scene.addItem(group)
 
         # Create and add the custom FolderBackdropItem
         folder_name = os.path.basename(folder_path)
-        backdrop_item = FolderBackdropItem(folder_name, backdrop_rect)
+        backdrop_item = FolderBackdropItem(folder_name, self.folder_backdrop_rect(folder_path))
         self.scene.addItem(backdrop_item)
 
-        # Store the backdrop item
+        # Store the backdrop item; the images lie inside it until one is dragged out
         self.loaded_images[folder_path]["backdrop"] = backdrop_item
+        self.loaded_images[folder_path]["bounds"] = backdrop_item.sceneBoundingRect()
+
+        # Low-detail stand-in shown instead of the images when zoomed far out
+        mosaic_item = self.build_folder_mosaic(folder_path, data.folder_max_width, data.folder_total_height)
+        self.scene.addItem(mosaic_item)
+        self.loaded_images[folder_path]["mosaic"] = mosaic_item
+        self.apply_folder_level_of_detail(folder_path)
+
+        # Pack the folder in after the others
+        self.place_folder(folder_path)
 
-        # Update offset for next folder
-        self.current_folder_offset_x += folder_max_width + 2 * self.SPACING_X
+    def layout_folder_images(self, folder_path):
+        """
+        Arranges a folder's image items in a grid, relative to the folder's
+        origin (the top-left image corner), and records the folder's size.
+
+        Args:
+            folder_path (str): The loaded folder.
+        """
+        data = self.folder_placement_data[folder_path]
+        images = self.loaded_images[folder_path]["images"]
+        # One pixmap() wrapper per item; each call hands back a new QPixmap object
+        sizes = [item.pixmap().size() for item in images]
+        positions, folder_max_width, folder_total_height = layout_grid(
+            [size.width() for size in sizes],
+            [size.height() for size in sizes],
+            self.COLUMNS, self.SPACING_X, self.SPACING_Y
+        )
+        for item, (x, y) in zip(images, positions):
+            # The (x, y) overload skips building a QPointF per image
+            item.setPos(x, y)
 
-    def on_image_load_error(self, filepath, error):
+        data.folder_max_width = folder_max_width
+        data.folder_total_height = folder_total_height
+
+    def folder_backdrop_rect(self, folder_path):
+        """
+        Returns a folder's backdrop rectangle relative to the folder's origin,
+        framing the images with SPACING_X/SPACING_Y on every side.
+
+        Args:
+            folder_path (str): The loaded folder.
+
+        Returns:
+            QRectF: The backdrop rectangle.
+        """
+        data = self.folder_placement_data[folder_path]
+        return QRectF(
+            -self.SPACING_X, -self.SPACING_Y,
+            data.folder_max_width + 2 * self.SPACING_X,
+            data.folder_total_height + 2 * self.SPACING_Y
+        )
+
+    def place_folder(self, folder_path):
+        """
+        Finds a spot for a loaded folder, label included, with the folder packer and moves it there.
+
+        Args:
+            folder_path (str): The loaded folder.
+        """
+        bounds = self.loaded_images[folder_path]["backdrop"].boundingRect()
+        x, y = self.folder_packer.place(bounds.width(), bounds.height())
+        self.move_folder(folder_path, x - bounds.left(), y - bounds.top())
+
+    def move_folder(self, folder_path, origin_x, origin_y):
+        """
+        Moves a loaded folder's images, backdrop and mosaic together. Everything is
+        laid out relative to the folder's origin, so this is three setPos calls
+        however many images the folder holds, and the cached bounds just shift along.
+
+        Args:
+            folder_path (str): The loaded folder.
+            origin_x (float): Scene x of the folder's first image column.
+            origin_y (float): Scene y of the folder's first image row.
+        """
+        entry = self.loaded_images[folder_path]
+        group = entry["group"]
+        entry["bounds"] = entry["bounds"].translated(origin_x - group.x(), origin_y - group.y())
+        for item in (group, entry["backdrop"], entry["mosaic"]):
+            item.setPos(origin_x, origin_y)
+        self.cull_timer.start()
+
+    def build_folder_mosaic(self, folder_path, width, height):
+        """
+        Paints all of a folder's images into one small pixmap, used at low zoom
+        so the view draws a single item per folder instead of every thumbnail.
+
+        Args:
+            folder_path (str): The loaded folder.
+            width (float): Width of the folder's image area.
+            height (float): Height of the folder's image area.
+
+        Returns:
+            QGraphicsPixmapItem: The mosaic item, scaled to cover the images; positioned by move_folder.
+        """
+        mosaic_scale = min(1.0, MOSAIC_MAX_SIZE / max(width, height, 1))
+        mosaic = QPixmap(max(1, ceil(width * mosaic_scale)), max(1, ceil(height * mosaic_scale)))
+        mosaic.fill(Qt.transparent)
+
+        painter = QPainter(mosaic)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        for item in self.loaded_images[folder_path]["images"]:
+            pix = item.pixmap()
+            target = QRectF(
+                item.x() * mosaic_scale, item.y() * mosaic_scale,
+                pix.width() * mosaic_scale, pix.height() * mosaic_scale
+            )
+            painter.drawPixmap(target, pix, QRectF(pix.rect()))
+        painter.end()
+
+        mosaic_item = QGraphicsPixmapItem(mosaic)
+        mosaic_item.setScale(1 / mosaic_scale)
+        return mosaic_item
+
+    def update_level_of_detail(self, zoom):
+        """
+        Switches every folder between its images and its mosaic when the zoom crosses the threshold.
+
+        Args:
+            zoom (float): The view's total scale factor.
+        """
+        low_detail = zoom < LOD_ZOOM_THRESHOLD
+        if low_detail == self.low_detail_active:
+            return
+        self.low_detail_active = low_detail
+        for folder_path in self.loaded_folders_order:
+            self.apply_folder_level_of_detail(folder_path)
+
+    def apply_folder_level_of_detail(self, folder_path):
+        """
+        Shows either a folder's images or its mosaic, based on the current detail level.
+
+        Args:
+            folder_path (str): The loaded folder.
+        """
+        entry = self.loaded_images[folder_path]
+        if entry["mosaic"] is None:
+            return
+        # Hiding the group hides all of its images in one call
+        on_screen = entry["on_screen"]
+        entry["group"].setVisible(on_screen and not self.low_detail_active)
+        entry["mosaic"].setVisible(on_screen and self.low_detail_active)
+
+    def cull_offscreen_folders(self):
+        """
+        Hides folders that lie entirely outside the viewport and shows them again
+        once they come back into view. Tested per folder, not per image, so a pan
+        costs one rectangle check for each loaded folder.
+        """
+        viewport_rect = self.view.viewport().rect().adjusted(-CULL_MARGIN, -CULL_MARGIN, CULL_MARGIN, CULL_MARGIN)
+        visible = self.view.mapToScene(viewport_rect).boundingRect()
+        for folder_path in self.loaded_folders_order:
+            entry = self.loaded_images[folder_path]
+            bounds = entry["bounds"]
+            if bounds is None:
+                continue
+            on_screen = bounds.intersects(visible)
+            if on_screen == entry["on_screen"]:
+                continue
+            entry["on_screen"] = on_screen
+            entry["backdrop"].setVisible(on_screen)
+            self.apply_folder_level_of_detail(folder_path)
+
+    def on_items_moved(self, items):
+        """
+        Grows the cached bounds of folders whose images were dragged or rotated, so
+        images moved outside their backdrop still keep the folder shown. The bounds
+        only grow; they are tightened again when the folder is laid out anew.
+
+        Args:
+            items (list): The scene items the view reported as possibly moved.
+        """
+        entries = {entry["group"]: entry for entry in self.loaded_images.values()}
+        for item in items:
+            entry = entries.get(item.parentItem())
+            if entry is not None and entry["bounds"] is not None:
+                entry["bounds"] = entry["bounds"].united(item.sceneBoundingRect())
+        self.cull_timer.start()
+
+    def on_image_load_error(self, folder_path, filepath, error):
+        # Give the slot back before the modal box so the other workers keep going
+        self.release_decode_slot()
         QMessageBox.warning(self, "Image Load Error", f"Failed to load {filepath}.\nError: {error}")
+        if folder_path in self.folder_placement_data:
+            self.on_image_processed(folder_path)
+
+    def release_decode_slot(self, count=1):
+        """
+        Returns decode slots once a worker's results have reached the GUI thread.
+
+        Args:
+            count (int, optional): How many results arrived. Defaults to 1.
+        """
+        self.pending_decodes -= count
+        self.decode_slots.release(count)
+
+    def stop_image_workers(self):
+        """
+        Drops queued image workers and unblocks running ones so the pool can shut down
+        even though the GUI thread will no longer drain their results.
+        """
+        self.thread_pool.clear()
+        if self.pending_decodes > 0:
+            self.decode_slots.release(self.pending_decodes)
+            self.pending_decodes = 0
 
     def update_progress(self, value):
+        if value == self.progress_bar.value():
+            return
         self.progress_bar.setValue(value)
         if value == 100:
             QTimer.singleShot(1000, self.progress_bar.hide)
@@ -546,24 +859,34 @@ class MainWindow(QMainWindow):
         Args:
             folder_path (str): The path of the folder to unload.
         """
+        walker = self.scanning_folders.pop(folder_path, None)
+        if walker is not None:
+            walker.cancel()
+        self.cancel_folder_workers(folder_path)
         if folder_path not in self.loaded_images:
             return  # Nothing to unload
 
-        # Remove image items
-        for item in self.loaded_images[folder_path]["images"]:
-            self.scene.removeItem(item)
+        # Remove image items; the group is only in the scene once loading completed
+        group = self.loaded_images[folder_path]["group"]
+        if group.scene() is not None:
+            self.scene.removeItem(group)
+        self.recycle_items(self.loaded_images[folder_path]["images"])
 
         # Remove backdrop
         backdrop_item = self.loaded_images[folder_path].get("backdrop")
         if backdrop_item:
             self.scene.removeItem(backdrop_item)
 
-        # Remove from loaded_images
+        mosaic_item = self.loaded_images[folder_path].get("mosaic")
+        if mosaic_item:
+            self.scene.removeItem(mosaic_item)
+
+        # Dropping the entry releases the last Python references to the group; with it
+        # out of the scene it is freed right here
         del self.loaded_images[folder_path]
 
         # Remove from the ordered list
-        if folder_path in self.loaded_folders_order:
-            self.loaded_folders_order.remove(folder_path)
+        self.loaded_folders_order.pop(folder_path, None)
 
         # Remove placement data
         if folder_path in self.folder_placement_data:
@@ -576,55 +899,44 @@ class MainWindow(QMainWindow):
         if not self.any_images_loaded():
             self.reset_canvas()
 
+    def cancel_folder_workers(self, folder_path):
+        """
+        Stops the image workers of a folder that is still loading. Each worker finishes
+        the image it is decoding, discards it and skips the rest of its chunk.
+
+        Args:
+            folder_path (str): The folder whose loading should stop.
+        """
+        for worker in self.folder_workers.pop(folder_path, ()):
+            worker.cancel()
+
+    def recycle_items(self, items):
+        """
+        Detaches a folder's image items and keeps them for the next folder load,
+        so toggling a folder does not rebuild thousands of graphics items.
+
+        Args:
+            items (list): The folder's DraggablePixmapItems, already out of the scene.
+        """
+        empty = QPixmap()
+        for item in items:
+            item.setParentItem(None)
+            # Let the old thumbnail go now rather than when the item is reused
+            item.setPixmap(empty)
+        self.item_pool.extend(items)
+
     def rearrange_folders(self):
         """
         Rearranges the positions of all loaded folders and their images based on the current order.
         """
-        self.current_folder_offset_x = 0  # Reset offset
+        self.folder_packer = SkylinePacker(FOLDER_PACK_WIDTH)
 
         for folder_path in self.loaded_folders_order:
-            data = self.folder_placement_data[folder_path]
-            folder_max_width = data["folder_max_width"]
-            folder_total_height = data["folder_total_height"]
-
-            # Define the new backdrop rectangle
-            rect_left = self.current_folder_offset_x - self.SPACING_X
-            rect_top = -self.SPACING_Y
-            rect_width = folder_max_width + 2 * self.SPACING_X
-            rect_height = folder_total_height + 2 * self.SPACING_Y
-
-            backdrop_rect = QRectF(rect_left, rect_top, rect_width, rect_height)
-
-            # Update backdrop item
-            backdrop_item = self.loaded_images[folder_path]["backdrop"]
-            backdrop_item.backdrop_rect = backdrop_rect
-            backdrop_item.text_rect = QRectF(
-                backdrop_rect.left(),
-                backdrop_rect.top() - backdrop_item.text_bbox.height() - backdrop_item.text_margin,
-                backdrop_rect.width(),
-                backdrop_item.text_bbox.height()
-            )
-            backdrop_item.total_rect = QRectF(
-                backdrop_rect.left(),
-                backdrop_item.text_rect.top(),
-                backdrop_rect.width(),
-                backdrop_rect.height() + backdrop_item.text_bbox.height() + backdrop_item.text_margin
-            )
-            backdrop_item.prepareGeometryChange()
-            backdrop_item.setPos(backdrop_rect.left(), backdrop_rect.top())
-
-            # Reposition images based on relative positions
-            for idx, image_item in enumerate(self.loaded_images[folder_path]["images"]):
-                if idx >= len(data["image_relative_positions"]):
-                    # Prevent index error if positions are mismatched
-                    continue
-                relative_x, relative_y = data["image_relative_positions"][idx]
-                new_x = backdrop_rect.left() + relative_x
-                new_y = backdrop_rect.top() + relative_y
-                image_item.setPos(QPointF(new_x, new_y))
-
-            # Update offset for the next folder
-            self.current_folder_offset_x += folder_max_width + 2 * self.SPACING_X
+            if self.loaded_images[folder_path]["backdrop"] is None:
+                # Still loading; placed after the other folders when it completes
+                continue
+            # Images keep their place inside the folder; only the folder moves
+            self.place_folder(folder_path)
 
     def any_images_loaded(self):
         return bool(self.loaded_images)
@@ -633,25 +945,20 @@ class MainWindow(QMainWindow):
         """
         Resets the canvas by clearing all items and resetting transformations.
         """
-        # Reset all folder offset
-        self.current_folder_offset_x = 0
+        # Start packing folders from the top-left again
+        self.folder_packer = SkylinePacker(FOLDER_PACK_WIDTH)
         self.view.resetTransform()
         self.view.centerOn(0,0)
         self.view.scale_factor_total = 1.0
+        self.low_detail_active = False
+        for folder_path in list(self.folder_workers):
+            self.cancel_folder_workers(folder_path)
         self.scene.clear()
         self.loaded_images.clear()
         self.folder_placement_data.clear()
         self.loaded_folders_order.clear()
         self.progress_bar.hide()
 
-    def reset_view(self):
-        """
-        Resets the view to its initial state without clearing the canvas.
-        """
-        self.view.resetTransform()
-        self.view.centerOn(0, 0)
-        self.view.scale_factor_total = 1.0
-
     def contextMenuEventHandler(self, position):
         """
         Handles the custom context menu event for the main window.
@@ -729,19 +1036,23 @@ class MainWindow(QMainWindow):
         self.SPACING_Y = new_spacing_y
         self.UNIFORM_HEIGHT = new_uniform_height
 
-        # Update existing placement data
+        # Re-flow the loaded folders with the new columns and spacing;
+        # folders still loading pick the settings up when they complete
         for folder_path in self.loaded_folders_order:
-            data = self.folder_placement_data.get(folder_path, {})
-            data["current_x"] = self.current_folder_offset_x
-            data["current_y"] = 0
-            data["images_in_row"] = 0
-            data["row_max_height"] = 0
-            data["folder_max_width"] = 0
-            data["folder_total_height"] = 0
-            data["image_relative_positions"] = []
-
-        # Reset folder offset and rearrange
-        self.current_folder_offset_x = 0
+            entry = self.loaded_images[folder_path]
+            if entry["backdrop"] is None:
+                continue
+            self.layout_folder_images(folder_path)
+            data = self.folder_placement_data[folder_path]
+            entry["backdrop"].set_backdrop_rect(self.folder_backdrop_rect(folder_path))
+            # The re-flow put every image back inside the backdrop
+            entry["bounds"] = entry["backdrop"].sceneBoundingRect()
+            self.scene.removeItem(entry["mosaic"])
+            entry["mosaic"] = self.build_folder_mosaic(folder_path, data.folder_max_width, data.folder_total_height)
+            self.scene.addItem(entry["mosaic"])
+            self.apply_folder_level_of_detail(folder_path)
+
+        # Repack the resized folders
         self.rearrange_folders()
 
         # Save the new settings
@@ -757,12 +1068,9 @@ class MainWindow(QMainWindow):
         item = self.directory_tree.itemAt(pos)
         if item:
             folder_path = item.data(0, Qt.UserRole)
-            menu = QMenu()
-            add_fav_action = menu.addAction("Add to Favorites")
-            action = menu.exec_(self.directory_tree.mapToGlobal(pos))
-            if action == add_fav_action:
+            action = self.directories_menu.exec_(self.directory_tree.mapToGlobal(pos))
+            if action == self.add_favorite_action:
                 self.add_favorite(folder_path)
-                self.save_favorites_to_json()
 
     def on_favorites_context_menu(self, pos):
         """
@@ -774,53 +1082,82 @@ class MainWindow(QMainWindow):
         item = self.favorites_tree.itemAt(pos)
         if item:
             folder_path = item.data(0, Qt.UserRole)
-            menu = QMenu()
-            remove_action = menu.addAction("Remove from Favorites")
-            chosen = menu.exec_(self.favorites_tree.mapToGlobal(pos))
-            if chosen == remove_action:
+            chosen = self.favorites_menu.exec_(self.favorites_tree.mapToGlobal(pos))
+            if chosen == self.remove_favorite_action:
                 self.remove_favorite(folder_path, item)
 
     def remove_favorite(self, folder_path, item):
         if folder_path in self.loaded_images:
             self.unload_images_from_folder(folder_path)
-        if folder_path in self.favorites:
-            self.favorites.remove(folder_path)
+        self.favorites.pop(folder_path, None)
         root = self.favorites_tree.invisibleRootItem()
         root.removeChild(item)
-        self.save_favorites_to_json()
+        self.schedule_favorites_save()
 
     def add_favorite(self, folder_path):
         if folder_path not in self.favorites:
-            self.favorites.append(folder_path)
+            self.favorites[folder_path] = None
         self.add_favorite_item(folder_path)
-        self.save_favorites_to_json()
+        self.schedule_favorites_save()
 
     def add_favorite_item(self, folder_path):
+        self.favorites_tree.addTopLevelItem(self.make_favorite_item(folder_path))
+
+    def make_favorite_item(self, folder_path):
+        """
+        Builds an unattached, checkable tree item for a favorite folder.
+
+        Args:
+            folder_path (str): The favorite folder.
+
+        Returns:
+            QTreeWidgetItem: The new item.
+        """
         fav_item = QTreeWidgetItem([os.path.basename(folder_path)])
         fav_item.setData(0, Qt.UserRole, folder_path)
         fav_item.setFlags(fav_item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
         fav_item.setCheckState(0, Qt.Unchecked)
-        self.favorites_tree.addTopLevelItem(fav_item)
-
-    def is_supported_image(self, filename):
-        _, ext = os.path.splitext(filename)
-        return ext.lower() in SUPPORTED_IMAGE_FORMATS
+        return fav_item
 
     def load_favorites_from_json(self):
         if os.path.exists(FAVORITES_FILE):
             try:
-                with open(FAVORITES_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(FAVORITES_FILE, 'rb') as f:
+                    data = json_loads(f.read())
                     if isinstance(data, list):
-                        return data
+                        return dict.fromkeys(data)
             except json.JSONDecodeError:
                 QMessageBox.warning(self, "JSON Error", f"Failed to parse {FAVORITES_FILE}.")
-        return []
+        return {}
+
+    def schedule_favorites_save(self):
+        """
+        Requests a favorites save. Requests arriving within the timer interval
+        are coalesced into a single write.
+        """
+        self.favorites_save_timer.start()
+
+    def flush_favorites_save(self):
+        """
+        Writes a pending favorites save immediately, e.g. before the application exits.
+        """
+        if self.favorites_save_timer.isActive():
+            self.favorites_save_timer.stop()
+            self.save_favorites_to_json()
+
+    def closeEvent(self, event):
+        self.flush_favorites_save()
+        super().closeEvent(event)
 
     def save_favorites_to_json(self):
+        # Stored as a JSON list, in the order the favorites were added
+        data = json_dumps(list(self.favorites))
+        if data == self.last_saved_favorites:
+            # Nothing changed since the last write
+            return
         try:
-            with open(FAVORITES_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.favorites, f, ensure_ascii=False, indent=4)
+            write_bytes_atomic(FAVORITES_FILE, data)
+            self.last_saved_favorites = data
         except Exception as e:
             QMessageBox.warning(self, "Save Error", f"Failed to save favorites.\nError: {e}")
 
@@ -830,8 +1167,8 @@ class MainWindow(QMainWindow):
         """
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(CONFIG_FILE, 'rb') as f:
+                    data = json_loads(f.read())
                     if isinstance(data, dict):
                         self.COLUMNS = data.get("COLUMNS", self.COLUMNS)
                         self.SPACING_X = data.get("SPACING_X", self.SPACING_X)
@@ -853,9 +1190,13 @@ class MainWindow(QMainWindow):
             "SPACING_Y": self.SPACING_Y,
             "UNIFORM_HEIGHT": self.UNIFORM_HEIGHT
         }
+        encoded = json_dumps(data)
+        if encoded == self.last_saved_settings:
+            # Nothing changed since the last write
+            return
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            write_bytes_atomic(CONFIG_FILE, encoded)
+            self.last_saved_settings = encoded
         except Exception as e:
             QMessageBox.warning(self, "Save Error", f"Failed to save settings.\nError: {e}")
 
@@ -866,9 +1207,12 @@ class MainWindow(QMainWindow):
         self.view.resetTransform()
         self.view.centerOn(0, 0)
         self.view.scale_factor_total = 1.0
+        self.update_level_of_detail(self.view.scale_factor_total)
+        self.cull_timer.start()
 
 def main():
     app = QApplication(sys.argv)
+    app.setApplicationName(APPLICATION_NAME)
     app.setStyle(QStyleFactory.create('Fusion'))
 
     window = MainWindow()
@@ -1,8 +1,15 @@
 # utils/constants.py
+# Which costs dominate loading, and which tuning knobs below address them: see PERF_NOTES.md
 
-SUPPORTED_IMAGE_FORMATS = ['.png', '.xpm', '.jpg', '.jpeg', '.bmp', '.gif']
+# Lowercase suffixes; a frozenset for O(1) membership tests on a single extension
+SUPPORTED_IMAGE_FORMATS = frozenset(('.png', '.xpm', '.jpg', '.jpeg', '.bmp', '.gif'))
+# Tuple form for str.endswith, which tests every suffix in one C call while scanning directories
+SUPPORTED_IMAGE_SUFFIXES = tuple(SUPPORTED_IMAGE_FORMATS)
 FAVORITES_FILE = "favorites.json"
 CONFIG_FILE = "config.json"
+# Sets the per-user cache location (QStandardPaths.CacheLocation) the thumbnails go under
+APPLICATION_NAME = "puredir"
+THUMBNAIL_CACHE_SUBDIR = "thumbnails"
 
 UNIFORM_HEIGHT = 150
 COLUMNS = 5
@@ -11,3 +18,18 @@ SPACING_Y = 10
 EDGE_RESIZE_MARGIN = 20
 INFINITE_CANVAS_SIZE = 10_000_000
 RIGHT_CLICK_DRAG_THRESHOLD = 5
+# Budget for GUI-side pixmaps of thumbnails, in KB (QPixmapCache's unit)
+PIXMAP_CACHE_LIMIT_KB = 128 * 1024
+# Image paths a directory walk hands to the GUI thread per signal
+WALK_CHUNK_SIZE = 256
+# Decoded thumbnails a worker hands to the GUI thread per signal
+IMAGE_BATCH_SIZE = 16
+# Width of the canvas strip folders are packed into; folders wrap below once a row is full
+FOLDER_PACK_WIDTH = 6000
+# Below this view zoom each folder is drawn as one mosaic pixmap instead of its individual images
+LOD_ZOOM_THRESHOLD = 0.1
+MOSAIC_MAX_SIZE = 512
+# Image items kept from unloaded folders for reuse by the next folder load
+ITEM_POOL_SIZE = 5000
+# Folders this many view pixels outside the viewport are still drawn, so they are ready when panned in
+CULL_MARGIN = 64
@@ -1,18 +1,124 @@
 # utils/helpers.py
 
+import os
 import sys
 import string
+from functools import lru_cache
+from utils.constants import SUPPORTED_IMAGE_SUFFIXES
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+    import json
+
+if sys.platform.startswith('win'):
+    from ctypes import windll
+else:
+    windll = None
+
+
+def json_loads(data):
+    """
+    Parses JSON from bytes, using orjson when it is installed.
+
+    Args:
+        data (bytes): The encoded JSON document.
+
+    Returns:
+        object: The decoded value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """
+    Serializes an object to indented UTF-8 JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj: The value to encode.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=4).encode('utf-8')
+
+
+def write_bytes_atomic(path, data):
+    """
+    Writes a file so that readers, and the file after a crash, only ever see
+    the old contents or the new ones, never a partial write.
+
+    Args:
+        path (str): The file to write.
+        data (bytes): The new contents.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=1)
 def get_windows_drives():
+    """
+    Lists the drive roots present on Windows. The result is cached for the session;
+    call invalidate_drive_cache() after drives are added or removed.
+
+    Returns:
+        tuple: Drive roots such as "C:\\", empty on other platforms or on failure.
+            A tuple, since every caller shares the cached value.
+    """
     drives = []
-    if sys.platform.startswith('win'):
+    if windll is not None:
         try:
-            from ctypes import windll
             bitmask = windll.kernel32.GetLogicalDrives()
             for letter in string.ascii_uppercase:
+                if not bitmask:
+                    break
                 if bitmask & 1:
                     drives.append(f"{letter}:\\")
                 bitmask >>= 1
         except Exception as e:
             print(f"Error fetching drives: {e}")
-    return drives
+    return tuple(drives)
+
+
+def invalidate_drive_cache():
+    """
+    Forgets the cached drive list, e.g. after a USB drive was plugged in.
+    """
+    get_windows_drives.cache_clear()
+
+
+def iter_supported_images(root_path):
+    """
+    Yields the paths of all supported images under root_path, recursively.
+
+    Uses an explicit os.scandir stack so each entry's type comes from the
+    directory read itself, and filters by extension while traversing.
+
+    Args:
+        root_path (str): The folder to scan.
+
+    Yields:
+        str: Path of a supported image file.
+    """
+    stack = [root_path]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(SUPPORTED_IMAGE_SUFFIXES):
+                        yield entry.path
+        except OSError:
+            continue
+        # Reversed so subfolders are visited in directory order, like os.walk
+        stack.extend(reversed(subdirs))
@@ -1,13 +1,20 @@
 # utils/image_cache.py
 
-from collections import OrderedDict
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QPixmap, QImage, QImageWriter
+import hashlib
+import heapq
+import itertools
+import os
 import threading
 
 
 class LRUCache:
     """
-    A simple thread-safe LRU (Least Recently Used) cache.
+    A thread-safe, approximately LRU (Least Recently Used) cache.
+
+    Reads take no lock: a hit only stamps the entry with a fresh ordinal, and
+    eviction drops the entries with the oldest stamps in bulk, so decode
+    threads never wait on each other for a lookup.
     """
 
     def __init__(self, capacity=100):
@@ -18,7 +25,8 @@ class LRUCache:
             capacity (int, optional): Maximum number of items to store. Defaults to 100.
         """
         self.capacity = capacity
-        self.cache = OrderedDict()
+        self.cache = {}  # key -> [value, last use ordinal]
+        self.counter = itertools.count()
         self.lock = threading.Lock()
 
     def get(self, key):
@@ -26,36 +34,34 @@ class LRUCache:
         Retrieves an item from the cache.
 
         Args:
-            key (str): The key to retrieve.
+            key: The key to retrieve.
 
         Returns:
-            QPixmap or None: The cached QPixmap or None if not found.
+            The cached value or None if not found.
         """
-        with self.lock:
-            if key not in self.cache:
-                return None
-            # Move the key to the end to indicate recent use
-            self.cache.move_to_end(key)
-            return self.cache[key]
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        # A single list store; next() on itertools.count is atomic under the GIL
+        entry[1] = next(self.counter)
+        return entry[0]
 
     def put(self, key, value):
         """
-        Adds an item to the cache.
+        Adds an item to the cache, evicting the least recently used quarter
+        once it grows past capacity.
 
         Args:
-            key (str): The key for the item.
-            value (QPixmap): The QPixmap to store.
+            key: The key for the item.
+            value: The value to store.
         """
         with self.lock:
-            if key in self.cache:
-                # Update existing item and move to end
-                self.cache.move_to_end(key)
-                self.cache[key] = value
-            else:
-                self.cache[key] = value
-                if len(self.cache) > self.capacity:
-                    # Remove least recently used item
-                    self.cache.popitem(last=False)
+            self.cache[key] = [value, next(self.counter)]
+            if len(self.cache) > self.capacity:
+                evict_count = len(self.cache) - self.capacity + self.capacity // 4
+                oldest = heapq.nsmallest(evict_count, self.cache.items(), key=lambda item: item[1][1])
+                for old_key, _ in oldest:
+                    del self.cache[old_key]
 
     def clear(self):
         """
@@ -63,3 +69,117 @@ class LRUCache:
         """
         with self.lock:
             self.cache.clear()
+
+
+class DiskThumbnailCache:
+    """
+    A persistent cache of decoded thumbnails, stored as WebP when Qt's WebP plugin
+    is available and as PNG otherwise.
+
+    Entries are keyed by sha1(path), the file's modification time and the
+    thumbnail height, so an edited source or a new height never hits a stale file.
+    """
+
+    def __init__(self, cache_dir):
+        """
+        Initializes the disk cache.
+
+        Args:
+            cache_dir (str): Directory holding the cached thumbnails. Created on demand.
+        """
+        self.cache_dir = cache_dir
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating thumbnail cache directory: {e}")
+        # WebP thumbnails are a fraction of the size of PNGs, so reading them back is cheaper
+        if b"webp" in QImageWriter.supportedImageFormats():
+            self.file_format, self.quality = "webp", 80
+        else:
+            self.file_format, self.quality = "png", -1
+
+    def cache_path(self, filepath, mtime_ns, height):
+        """
+        Builds the cache file path for a source image.
+
+        Args:
+            filepath (str): The source image path.
+            mtime_ns (int): The source's modification time, as from os.stat().st_mtime_ns.
+            height (int): The thumbnail height.
+
+        Returns:
+            str: The cache file path.
+        """
+        key = hashlib.sha1(filepath.encode('utf-8')).hexdigest()
+        # The "o" suffix marks thumbnails with EXIF orientation applied, so files
+        # written before that was done are never picked up. Files are spread over
+        # 256 subdirectories so no single directory grows to hundreds of thousands of entries
+        return os.path.join(self.cache_dir, key[:2], f"{key}_{mtime_ns}_{height}o.{self.file_format}")
+
+    def get(self, filepath, mtime_ns, height):
+        """
+        Retrieves a cached thumbnail.
+
+        Args:
+            filepath (str): The source image path.
+            mtime_ns (int): The source's modification time in nanoseconds.
+            height (int): The thumbnail height.
+
+        Returns:
+            QImage or None: The cached thumbnail or None if not found.
+        """
+        # A missing file just loads as a null image; no separate existence check
+        img = QImage(self.cache_path(filepath, mtime_ns, height))
+        return None if img.isNull() else img
+
+    def put(self, filepath, mtime_ns, height, img):
+        """
+        Writes a thumbnail to the cache. Failures are ignored; the cache is best effort.
+
+        Args:
+            filepath (str): The source image path.
+            mtime_ns (int): The source's modification time in nanoseconds.
+            height (int): The thumbnail height.
+            img (QImage): The thumbnail to store.
+        """
+        path = self.cache_path(filepath, mtime_ns, height)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        except OSError:
+            return
+        # Write to a temporary name first so a concurrent reader never sees a partial file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            if not img.save(tmp_path, self.file_format, self.quality):
+                raise OSError(f"could not write {tmp_path}")
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self.remove_superseded(path)
+
+    def remove_superseded(self, path):
+        """
+        Deletes older thumbnails of the same source, written for a previous
+        modification time or height, so the cache doesn't keep growing with every edit.
+
+        Args:
+            path (str): The cache file just written; it is kept.
+        """
+        shard_dir, name = os.path.split(path)
+        prefix = name[:name.index("_") + 1]
+        try:
+            with os.scandir(shard_dir) as entries:
+                stale = [entry.path for entry in entries
+                         if entry.name.startswith(prefix) and entry.name != name
+                         and not entry.name.endswith(".tmp")]
+        except OSError:
+            return
+        for stale_path in stale:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
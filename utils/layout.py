@@ -0,0 +1,145 @@
+# utils/layout.py
+
+
+class FolderLayout:
+    """
+    Load progress and placement state of one loaded folder. Slotted, since it is
+    read for every arriving batch of thumbnails and every folder move.
+    """
+
+    __slots__ = ("image_count", "loaded_count", "pixmaps", "folder_max_width", "folder_total_height")
+
+    def __init__(self, image_count):
+        """
+        Initializes the FolderLayout.
+
+        Args:
+            image_count (int): Number of images handed to the folder's workers so far.
+        """
+        self.image_count = image_count
+        self.loaded_count = 0  # Images finished or failed so far
+        self.pixmaps = [None] * image_count  # Filled by index as workers finish; None once placed
+        self.folder_max_width = 0
+        self.folder_total_height = 0
+
+
+def layout_grid(widths, heights, columns, spacing_x, spacing_y):
+    """
+    Lays images out left to right in rows of at most `columns` images.
+
+    Computed in one pass once a folder's sizes are all known, instead of
+    updating running counters every time an image arrives.
+
+    Args:
+        widths (list): Image widths, in display order.
+        heights (list): Image heights, in display order.
+        columns (int): Maximum number of images per row.
+        spacing_x (int): Horizontal gap between images.
+        spacing_y (int): Vertical gap between rows.
+
+    Returns:
+        tuple: (positions, max_width, total_height) where positions is a list of
+        (x, y) offsets from the folder's top-left image corner.
+    """
+    positions = []
+    x = y = 0
+    row_height = 0
+    max_width = 0
+    for index, (width, height) in enumerate(zip(widths, heights)):
+        if index and index % columns == 0:
+            # Start a new row below the tallest image of the previous one
+            y += row_height + spacing_y
+            x = 0
+            row_height = 0
+        positions.append((x, y))
+        x += width
+        if x > max_width:
+            max_width = x
+        x += spacing_x
+        if height > row_height:
+            row_height = height
+    return positions, max_width, y + row_height
+
+
+class SkylinePacker:
+    """
+    Packs rectangles into a strip of fixed width, one at a time. Each rectangle goes
+    to the highest free spot along the skyline (the lower edge of what is already
+    placed), leftmost on ties, so folders fill rows instead of one endless line.
+    """
+
+    def __init__(self, width):
+        """
+        Initializes the SkylinePacker.
+
+        Args:
+            width (float): Width of the strip. Wider rectangles are placed alone at its left edge.
+        """
+        self.width = width
+        self.segments = [(0, width, 0)]  # (x, width, y) spans of the skyline, sorted by x
+
+    def place(self, width, height):
+        """
+        Finds the position for a rectangle and raises the skyline under it.
+
+        Args:
+            width (float): The rectangle's width.
+            height (float): The rectangle's height.
+
+        Returns:
+            tuple: (x, y) of the rectangle's top-left corner.
+        """
+        best_x = best_y = None
+        for x, _, _ in self.segments:
+            if x + width > self.width:
+                break
+            y = self.top_under(x, width)
+            if best_y is None or y < best_y:
+                best_x, best_y = x, y
+        if best_y is None:
+            # Wider than the strip; start it below everything placed so far
+            best_x, best_y = 0, max(y for _, _, y in self.segments)
+        self.raise_skyline(best_x, width, best_y + height)
+        return best_x, best_y
+
+    def top_under(self, x, width):
+        """
+        Returns the lowest skyline point over a horizontal span.
+
+        Args:
+            x (float): Left edge of the span.
+            width (float): Width of the span.
+
+        Returns:
+            float: The largest y of the skyline segments overlapping the span.
+        """
+        right = x + width
+        return max(seg_y for seg_x, seg_width, seg_y in self.segments if seg_x < right and seg_x + seg_width > x)
+
+    def raise_skyline(self, x, width, y):
+        """
+        Sets the skyline over a span to y, merging neighbours at the same height.
+
+        Args:
+            x (float): Left edge of the span.
+            width (float): Width of the span.
+            y (float): The new skyline height over the span.
+        """
+        right = x + width
+        segments = [(x, width, y)]
+        for seg_x, seg_width, seg_y in self.segments:
+            seg_right = seg_x + seg_width
+            if seg_x < x:
+                segments.append((seg_x, min(seg_right, x) - seg_x, seg_y))
+            if seg_right > right:
+                start = max(seg_x, right)
+                segments.append((start, seg_right - start, seg_y))
+        segments.sort()
+        merged = [segments[0]]
+        for seg in segments[1:]:
+            last_x, last_width, last_y = merged[-1]
+            if seg[2] == last_y and seg[0] == last_x + last_width:
+                merged[-1] = (last_x, last_width + seg[1], last_y)
+            else:
+                merged.append(seg)
+        self.segments = merged
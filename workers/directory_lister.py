@@ -0,0 +1,30 @@
+# workers/directory_lister.py
+
+import os
+from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
+
+
+class DirectoryListSignals(QObject):
+    listed = pyqtSignal(str, list)  # path, [(name, subdir_path), ...]
+    error = pyqtSignal(str, Exception)  # path, error
+
+
+class DirectoryListWorker(QRunnable):
+    """
+    Lists the subdirectories of one folder on a pool thread, so expanding a
+    tree item on a slow or network drive does not block the GUI.
+    """
+
+    def __init__(self, path, signals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        try:
+            with os.scandir(self.path) as it:
+                subdirs = [(entry.name, entry.path) for entry in it if entry.is_dir()]
+        except OSError as e:
+            self.signals.error.emit(self.path, e)
+            return
+        self.signals.listed.emit(self.path, subdirs)
@@ -0,0 +1,47 @@
+# workers/directory_walker.py
+
+from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
+from utils.constants import WALK_CHUNK_SIZE
+from utils.helpers import iter_supported_images
+
+
+class DirectoryWalkSignals(QObject):
+    found = pyqtSignal(str, object, list)  # folder_path, worker, chunk of file_paths
+    finished = pyqtSignal(str, object)  # folder_path, worker
+
+
+class DirectoryWalkWorker(QRunnable):
+    """
+    Collects the supported images under a folder on a pool thread,
+    so slow or network drives do not block the GUI.
+
+    Paths are handed over in chunks as they are found, so decoding can start
+    long before a large tree has been walked completely.
+    """
+
+    def __init__(self, folder_path, signals):
+        super().__init__()
+        self.folder_path = folder_path
+        self.signals = signals
+        self.cancelled = False
+
+    def run(self):
+        chunk = []
+        for filepath in iter_supported_images(self.folder_path):
+            if self.cancelled:
+                # The folder was unchecked; stop walking
+                return
+            chunk.append(filepath)
+            if len(chunk) >= WALK_CHUNK_SIZE:
+                self.signals.found.emit(self.folder_path, self, chunk)
+                chunk = []
+        if chunk:
+            self.signals.found.emit(self.folder_path, self, chunk)
+        self.signals.finished.emit(self.folder_path, self)
+
+    def cancel(self):
+        """
+        Asks the worker to stop walking. Safe to call from the GUI thread,
+        including after the worker has finished.
+        """
+        self.cancelled = True
@@ -1,33 +1,201 @@
 # workers/image_loader.py
 
-from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
-from PyQt5.QtGui import QPixmap
-from utils.constants import SUPPORTED_IMAGE_FORMATS, UNIFORM_HEIGHT
+import hashlib
+import os
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QRunnable, QSize, QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage, QImageReader, QImageIOHandler
+from utils.constants import IMAGE_BATCH_SIZE
+
 
 class ImageLoadSignals(QObject):
-    finished = pyqtSignal(str, str, QPixmap, float)  # folder_path, filepath, pix, scale_factor
-    error = pyqtSignal(str, Exception)
-    progress = pyqtSignal(int)
+    finished = pyqtSignal(str, list)  # folder_path, [(index in folder, img already at uniform height), ...]
+    error = pyqtSignal(str, str, Exception)  # folder_path, filepath, error
+
 
 class ImageLoadWorker(QRunnable):
-    def __init__(self, folder_path, filepaths):
+    """
+    Decodes one chunk of a folder's images on a pool thread.
+
+    A folder is split into several workers that all emit through the same
+    ImageLoadSignals object, so the GUI thread sees a single stream of results.
+    """
+
+    def __init__(self, folder_path, indexed_filepaths, uniform_height, image_cache, content_index, disk_cache,
+                 signals, decode_slots):
         super().__init__()
         self.folder_path = folder_path
-        self.filepaths = filepaths
-        self.signals = ImageLoadSignals()
+        self.indexed_filepaths = indexed_filepaths  # [(index, filepath), ...]
+        self.uniform_height = uniform_height
+        self.signals = signals
+        self.image_cache = image_cache
+        self.content_index = content_index  # content hash -> path key of an identical file's thumbnail
+        self.disk_cache = disk_cache
+        self.decode_slots = decode_slots  # QSemaphore bounding results not yet taken by the GUI
+        self.cancelled = False
 
     def run(self):
-        total = len(self.filepaths)
-        for i, filepath in enumerate(self.filepaths):
+        next_paths = [filepath for _, filepath in self.indexed_filepaths[1:]] + [None]
+        batch = []
+        for (index, filepath), next_path in zip(self.indexed_filepaths, next_paths):
+            if self.cancelled:
+                # The folder was unloaded; skip whatever is left of this chunk
+                self.decode_slots.release(len(batch))
+                return
+            # Wait while the GUI thread is behind; it releases the slots once it takes the results.
+            # Hand over what this worker holds before blocking, or its own batch could starve it
+            if not self.decode_slots.tryAcquire():
+                self.flush(batch)
+                self.decode_slots.acquire()
             try:
-                pix = QPixmap(filepath)
-                if pix.isNull():
-                    raise ValueError(f"Could not load image: {filepath}")
-                
-                scale_factor = UNIFORM_HEIGHT / pix.height()
-                self.signals.finished.emit(self.folder_path, filepath, pix, scale_factor)
-                
-                progress = int((i + 1) / total * 100)
-                self.signals.progress.emit(progress)
+                img = self.load_thumbnail(filepath, next_path)
             except Exception as e:
-                self.signals.error.emit(filepath, e)
+                self.signals.error.emit(self.folder_path, filepath, e)
+                continue
+            if self.cancelled:
+                # Don't let a late result land in a fresh load of the same folder
+                self.decode_slots.release(len(batch) + 1)
+                return
+            # The index lets the GUI keep file order
+            batch.append((index, img))
+            if len(batch) >= IMAGE_BATCH_SIZE:
+                self.flush(batch)
+        self.flush(batch)
+
+    def flush(self, batch):
+        """
+        Emits the results collected so far as one queued signal and empties the batch.
+
+        Args:
+            batch (list): (index, img) pairs not yet handed to the GUI thread.
+        """
+        if batch:
+            self.signals.finished.emit(self.folder_path, batch[:])
+            batch.clear()
+
+    def cancel(self):
+        """
+        Asks the worker to stop before its next image. Safe to call from the GUI thread,
+        including after the worker has finished.
+        """
+        self.cancelled = True
+
+    def load_thumbnail(self, filepath, next_path=None):
+        """
+        Returns the thumbnail for a file, decoding only when no cache can supply it.
+
+        Lookups go from cheapest to most expensive: the in-memory cache by path and mtime,
+        the disk cache by path and mtime, then the content index, which points an
+        identical file under another path at its in-memory thumbnail, so such files
+        are decoded once.
+
+        Args:
+            filepath (str): The image file to load.
+            next_path (str, optional): The file this worker loads next; read ahead
+                while this one decodes if this one has to come from disk.
+
+        Returns:
+            QImage: The thumbnail at the uniform height. QPixmap is left to the GUI
+            thread, since pixmaps are not safe to create on pool threads.
+        """
+        # One stat serves both caches; keying on mtime means an edited file is never
+        # served from a thumbnail of its old contents
+        mtime_ns = os.stat(filepath).st_mtime_ns
+        path_key = (filepath, mtime_ns, self.uniform_height)
+        img = self.image_cache.get(path_key)
+        if img is not None:
+            return img
+
+        img = self.disk_cache.get(filepath, mtime_ns, self.uniform_height)
+        if img is not None:
+            img = self.to_display_format(img)
+        else:
+            # Cache misses tend to come in runs (a folder never opened before), so
+            # start the next file's read before blocking on this one
+            self.prefetch(next_path)
+            with open(filepath, 'rb') as f:
+                data = f.read()
+            content_key = (hashlib.blake2b(data, digest_size=16).digest(), self.uniform_height)
+            # The index stores path keys, not images, so the thumbnail cache holds each
+            # thumbnail once and its capacity counts distinct images
+            source_key = self.content_index.get(content_key)
+            img = None if source_key is None else self.image_cache.get(source_key)
+            if img is None:
+                img = self.read_scaled(filepath, data)
+                self.disk_cache.put(filepath, mtime_ns, self.uniform_height, img)
+                self.content_index.put(content_key, path_key)
+
+        self.image_cache.put(path_key, img)
+        return img
+
+    def prefetch(self, filepath):
+        """
+        Asks the kernel to start reading a file into the page cache without waiting
+        for it. Does nothing where posix_fadvise is unavailable (Windows, macOS).
+
+        Args:
+            filepath (str or None): The file to read ahead.
+        """
+        if filepath is None or not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def read_scaled(self, filepath, data):
+        """
+        Decodes an image at the uniform height. When the format allows it the decoder
+        scales directly, so JPEGs skip the full-resolution decode.
+
+        Args:
+            filepath (str): The image file, used for the format hint and error messages.
+            data (bytes): The file contents.
+
+        Returns:
+            QImage: The decoded image.
+        """
+        buffer = QBuffer()
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer, filepath.rpartition('.')[2].lower().encode())
+        # Honour EXIF orientation so camera photos are not shown on their side
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid() and size.width() > 0 and size.height() > 0:
+            # The scaled size applies before the orientation transform, so for a
+            # quarter turn the stored width becomes the displayed height
+            if reader.transformation() & QImageIOHandler.TransformationRotate90:
+                height = max(1, round(size.height() * self.uniform_height / size.width()))
+                reader.setScaledSize(QSize(self.uniform_height, height))
+            else:
+                width = max(1, round(size.width() * self.uniform_height / size.height()))
+                reader.setScaledSize(QSize(width, self.uniform_height))
+        img = reader.read()
+        if img.isNull():
+            raise ValueError(f"Could not load image: {filepath} ({reader.errorString()})")
+        if img.height() != self.uniform_height:
+            # The reader could not scale during decode; resample once here rather than on every paint
+            img = img.scaledToHeight(self.uniform_height, Qt.SmoothTransformation)
+        return self.to_display_format(img)
+
+    def to_display_format(self, img):
+        """
+        Converts an image to the format the raster paint engine blits directly, so
+        QPixmap.fromImage on the GUI thread does not have to convert it.
+
+        Args:
+            img (QImage): The decoded thumbnail.
+
+        Returns:
+            QImage: The image as premultiplied ARGB32 if it has alpha, otherwise RGB32.
+        """
+        target = QImage.Format_ARGB32_Premultiplied if img.hasAlphaChannel() else QImage.Format_RGB32
+        if img.format() == target:
+            return img
+        return img.convertToFormat(target)